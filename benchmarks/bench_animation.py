@@ -0,0 +1,310 @@
+"""
+Per-frame cost of the animation methods of the package, rendered headless.
+
+Run from the repository root with:
+
+.. code-block:: bash
+
+    python benchmarks/bench_animation.py --quality low_quality --output animation.json
+    python benchmarks/bench_animation.py --classes Bubble --template dark_energy
+
+Every script builds an object and plays its animation methods in order through a
+:class:`Scene` in manim's dry-run mode: frames are drawn by the Cairo camera in
+memory, but nothing is written to disk. For each method it reports, per frame:
+
+- ``update``: time to advance the animations and run the updaters (mean and p95, ms).
+- ``render``: time to draw the frame (mean and p95, ms).
+- ``mobjects``: mobjects created or copied while updating (e.g. by ``always_redraw``
+  or ``become``), mean per frame. Mobjects built when an animation begins are not
+  counted, so ``0`` means that the frames themselves build nothing.
+- ``blocks``: change in the number of memory blocks allocated by Python, mean per frame.
+- ``updaters``: mobjects of the scene with updaters, at the end of the method.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+
+import manim
+import numpy as np
+from manim import *
+
+from manim_string_cosmo import *
+from manim_string_cosmo.__version__ import __version__
+
+BUBBLE_TYPES = ["empty", "instanton", "radiation", "GW", "strings", "em"]
+
+# (class name, variant, builder, what to add before playing, methods to play).
+SCRIPTS = (
+    [
+        (
+            "Bubble",
+            t,
+            lambda t=t: Bubble(bubble_type=t),
+            None,
+            ["fade_in_bulk", "create_bubble", "expand_bubble"]
+            + (["show_radius"] if t == "empty" else []),
+        )
+        for t in BUBBLE_TYPES
+    ]
+    + [
+        (
+            "Bubble",
+            "energy_discussion",
+            lambda: Bubble(bubble_type="energy_discussion"),
+            None,
+            ["fade_in_bulk", "fail_creation", "create_bubble", "expand_bubble"],
+        ),
+        (
+            "AdS_Jc",
+            "RS",
+            lambda: AdS_Jc(vacua_type="RS"),
+            None,
+            [
+                "fade_in",
+                "fade_in_arrow",
+                "show_symmetry",
+                "restore_symmetry",
+                "show_n_vector_rs",
+            ],
+        ),
+        (
+            "AdS_Jc",
+            "DB",
+            lambda: AdS_Jc(vacua_type="DB"),
+            None,
+            ["fade_in", "fade_in_arrow", "show_n_vector_db"],
+        ),
+    ]
+    + [
+        (
+            "Black_Hole",
+            t,
+            lambda t=t: Black_Hole(bh_type=t),
+            lambda mob: mob,
+            ["nucleate", "expand"],
+        )
+        for t in ["none", "fragmentation", "spinning"]
+    ]
+    + [
+        (
+            "Plot_Induced_Potential",
+            "-",
+            Plot_Induced_Potential,
+            lambda mob: mob[0],
+            [
+                "show_potential",
+                "show_jc",
+                "nucleate_brane",
+                "accelerate",
+                "bounce",
+                "add_cc_and_expand",
+            ],
+        ),
+        (
+            "Plot_Instanton",
+            "-",
+            Plot_Instanton,
+            lambda mob: mob[0],
+            ["fade_in_field_position", "decay"],
+        ),
+        (
+            "Plot_Quantum",
+            "-",
+            Plot_Quantum,
+            lambda mob: mob[0],
+            ["create_wave_functions"],
+        ),
+        (
+            "Plot_Lambda_Tension",
+            "-",
+            Plot_Lambda_Tension,
+            lambda mob: mob[0],
+            ["create_function"],
+        ),
+        (
+            "Table_Bh_Embedding",
+            "together",
+            lambda: Table_Bh_Embedding(type="together"),
+            lambda mob: mob,
+            ["move_all"],
+        ),
+        (
+            "Table_Bh_Embedding",
+            "split",
+            lambda: Table_Bh_Embedding(type="split"),
+            lambda mob: mob,
+            ["move_non_compact", "move_compact"],
+        ),
+    ]
+)
+
+
+class Frame_Counter:
+    """Count the mobjects created or copied while installed."""
+
+    def __init__(self):
+        self.created = 0
+        self._original_init = Mobject.__init__
+        self._original_deepcopy = Mobject.__deepcopy__
+
+    def __enter__(self):
+        original_init = self._original_init
+        original_deepcopy = self._original_deepcopy
+
+        def counting_init(mob, *args, **kwargs):
+            self.created += 1
+            original_init(mob, *args, **kwargs)
+
+        # ``copy``, ``become`` and ``.animate`` build mobjects without ``__init__``,
+        # through one ``__deepcopy__`` per member of the copied family.
+        def counting_deepcopy(mob, memo):
+            self.created += 1
+            return original_deepcopy(mob, memo)
+
+        Mobject.__init__ = counting_init
+        Mobject.__deepcopy__ = counting_deepcopy
+        return self
+
+    def __exit__(self, *exc_info):
+        Mobject.__init__ = self._original_init
+        Mobject.__deepcopy__ = self._original_deepcopy
+
+
+class Timed_Scene(Scene):
+    """Scene playing one script and timing every frame of every method."""
+
+    def __init__(self, builder, add, steps: list, **kwargs):
+        super().__init__(**kwargs)
+        self.builder = builder
+        self.add_first = add
+        self.steps = steps
+        self.frames = {step: [] for step in steps}
+        # Not ``updaters``: the scene has its own list of updaters by that name.
+        self.step_updaters = {}
+        self._current = None
+        self._counter = Frame_Counter()
+
+    def construct(self):
+        mob = self.builder()
+        if self.add_first is not None:
+            self.add(self.add_first(mob))
+
+        render = self.renderer.render
+
+        def timed_render(*args, **kwargs):
+            start = time.perf_counter()
+            render(*args, **kwargs)
+            if self._current is not None:
+                self.frames[self._current][-1]["render"] = time.perf_counter() - start
+
+        self.renderer.render = timed_render
+        with self._counter:
+            for step in self.steps:
+                self._current = step
+                self.play(getattr(mob, step)())
+                self.step_updaters[step] = sum(
+                    1
+                    for sub in self.get_mobject_family_members()
+                    if sub.get_updaters()
+                )
+        self._current = None
+
+    def update_to_time(self, t: float):
+        if self._current is None:
+            return super().update_to_time(t)
+        created = self._counter.created
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        super().update_to_time(t)
+        self.frames[self._current].append(
+            {
+                "update": time.perf_counter() - start,
+                "render": 0.0,
+                "mobjects": self._counter.created - created,
+                "blocks": sys.getallocatedblocks() - blocks,
+            }
+        )
+
+
+def summarize(frames: list) -> dict:
+    """Mean/p95 of the frame timings (ms) and mean allocation counts of one method."""
+    if not frames:
+        return {"frames": 0}
+    update = 1e3 * np.array([frame["update"] for frame in frames])
+    render = 1e3 * np.array([frame["render"] for frame in frames])
+    return {
+        "frames": len(frames),
+        "update_mean_ms": round(float(update.mean()), 3),
+        "update_p95_ms": round(float(np.percentile(update, 95)), 3),
+        "render_mean_ms": round(float(render.mean()), 3),
+        "render_p95_ms": round(float(np.percentile(render, 95)), 3),
+        "mobjects_per_frame": round(float(np.mean([f["mobjects"] for f in frames])), 2),
+        "blocks_per_frame": round(float(np.mean([f["blocks"] for f in frames])), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quality", default="low_quality")
+    parser.add_argument("--template", default="default_template")
+    parser.add_argument("--classes", nargs="+", default=None, help="Default: all.")
+    parser.add_argument("--output", help="JSON file for the results.")
+    args = parser.parse_args()
+
+    scripts = [s for s in SCRIPTS if not args.classes or s[0] in args.classes]
+    options = {
+        "dry_run": True,
+        "quality": args.quality,
+        "disable_caching": True,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+    }
+
+    header = (
+        f"{'class':<24}{'variant':<19}{'method':<24}{'frames':>7}"
+        f"{'upd ms':>9}{'upd p95':>9}{'rnd ms':>9}{'mob/f':>8}{'updaters':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    results = []
+    with tempconfig(options), get_template(args.template):
+        for class_name, variant, builder, add, steps in scripts:
+            scene = Timed_Scene(builder, add, steps)
+            scene.render()
+            for step in steps:
+                figures = summarize(scene.frames[step])
+                figures["updaters"] = scene.step_updaters.get(step, 0)
+                results.append(
+                    {"class": class_name, "variant": variant, "method": step, **figures}
+                )
+                if figures["frames"]:
+                    print(
+                        f"{class_name:<24}{variant:<19}{step:<24}{figures['frames']:>7}"
+                        f"{figures['update_mean_ms']:>9.2f}{figures['update_p95_ms']:>9.2f}"
+                        f"{figures['render_mean_ms']:>9.2f}"
+                        f"{figures['mobjects_per_frame']:>8.1f}{figures['updaters']:>9}"
+                    )
+
+    if args.output:
+        report = {
+            "meta": {
+                "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "manim": manim.__version__,
+                "manim_string_cosmo": __version__,
+                "platform": platform.platform(),
+                "quality": args.quality,
+                "template": args.template,
+            },
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
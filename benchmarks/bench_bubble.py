@@ -0,0 +1,66 @@
+"""
+Build time and memory of :class:`Bubble` per ``bubble_type``, eager vs lazy construction.
+
+Run from the repository root with:
+
+.. code-block:: bash
+
+    python benchmarks/bench_bubble.py --repeat 20
+
+``eager`` (``lazy=False``) builds every asset of every bubble type, as the
+constructor used to do. ``lazy`` (the default) only builds what the chosen type needs.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from manim_string_cosmo import Bubble
+
+BUBBLE_TYPES = [
+    "empty",
+    "instanton",
+    "radiation",
+    "GW",
+    "strings",
+    "em",
+    "energy_discussion",
+]
+
+
+def measure(bubble_type: str, lazy: bool, repeat: int) -> tuple:
+    """Return the mean build time (ms) and peak traced memory (KiB) of one bubble."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        Bubble(bubble_type=bubble_type, lazy=lazy)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    Bubble(bubble_type=bubble_type, lazy=lazy)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return 1e3 * elapsed, peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    # Warm up LaTeX and SVG caches so both modes are compared on geometry only.
+    for bubble_type in BUBBLE_TYPES:
+        Bubble(bubble_type=bubble_type, lazy=False)
+
+    header = f"{'bubble_type':<20}{'eager ms':>10}{'lazy ms':>10}{'eager KiB':>12}{'lazy KiB':>12}"
+    print(header)
+    print("-" * len(header))
+    for bubble_type in BUBBLE_TYPES:
+        eager_t, eager_m = measure(bubble_type, lazy=False, repeat=args.repeat)
+        lazy_t, lazy_m = measure(bubble_type, lazy=True, repeat=args.repeat)
+        print(
+            f"{bubble_type:<20}{eager_t:>10.2f}{lazy_t:>10.2f}{eager_m:>12.0f}{lazy_m:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
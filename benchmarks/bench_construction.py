@@ -0,0 +1,207 @@
+"""
+Construction cost of every public class, per variant and per template, as JSON.
+
+Run from the repository root with:
+
+.. code-block:: bash
+
+    python benchmarks/bench_construction.py --repeat 5 --output construction.json
+    python benchmarks/bench_construction.py --templates dark_energy --classes Bubble
+
+For each case the first build is the ``cold`` one: it pays for LaTeX (unless the
+labels are already compiled on disk) and is only used to measure ``latex_ms`` and
+``latex_runs``, the cost of the LaTeX processes themselves. The following builds are
+``warm`` and give the other numbers:
+
+- ``build_ms``: median construction time.
+- ``tex_ms``: part of it spent building :class:`MathTex`/:class:`Tex` labels
+  (reading and parsing their SVG files).
+- ``geometry_ms``: the rest, i.e. ``build_ms - tex_ms``.
+- ``peak_kib``: peak memory allocated during one build (``tracemalloc``).
+- ``submobjects``: number of mobjects in the family of the object, itself excluded.
+- ``bezier_points``: number of points of all those mobjects.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import manim
+from manim.mobject.text import tex_mobject
+from manim.utils import tex_file_writing
+
+from manim_string_cosmo import *
+from manim_string_cosmo.__version__ import __version__
+
+BUBBLE_TYPES = [
+    "empty",
+    "instanton",
+    "radiation",
+    "GW",
+    "strings",
+    "em",
+    "energy_discussion",
+]
+
+# (class name, variant, builder). The variant is the argument that changes what
+# is built, or "-" for classes without one.
+CASES = (
+    [("Bubble", t, lambda t=t: Bubble(bubble_type=t)) for t in BUBBLE_TYPES]
+    + [("AdS_Jc", t, lambda t=t: AdS_Jc(vacua_type=t)) for t in ["RS", "DB"]]
+    + [
+        ("Black_Hole", t, lambda t=t: Black_Hole(bh_type=t))
+        for t in ["none", "fragmentation", "spinning"]
+    ]
+    + [
+        ("Plot_Induced_Potential", "-", Plot_Induced_Potential),
+        ("Plot_Instanton", "-", Plot_Instanton),
+        ("Plot_Quantum", "-", Plot_Quantum),
+        ("Plot_Lambda_Tension", "-", Plot_Lambda_Tension),
+    ]
+    + [
+        ("Table_Bh_Embedding", t, lambda t=t: Table_Bh_Embedding(type=t))
+        for t in ["together", "split"]
+    ]
+    + [
+        ("Table_Energy_Scales", "-", Table_Energy_Scales),
+        ("Table_Summary_Induce", "-", Table_Summary_Induce),
+    ]
+)
+
+
+class Tex_Timer:
+    """Accumulate the time spent in LaTeX runs and in building labels."""
+
+    def __init__(self):
+        self.latex_s = 0.0
+        self.latex_runs = 0
+        self.tex_s = 0.0
+        self._depth = 0
+
+    @contextmanager
+    def installed(self):
+        original_compile = tex_file_writing.compile_tex
+        original_init = tex_mobject.SingleStringMathTex.__init__
+
+        def timed_compile(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original_compile(*args, **kwargs)
+            finally:
+                self.latex_s += time.perf_counter() - start
+                self.latex_runs += 1
+
+        def timed_init(mob, *args, **kwargs):
+            # Labels can build labels (e.g. MathTex parts): only time the outer one.
+            self._depth += 1
+            start = time.perf_counter()
+            try:
+                original_init(mob, *args, **kwargs)
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.tex_s += time.perf_counter() - start
+
+        tex_file_writing.compile_tex = timed_compile
+        tex_mobject.SingleStringMathTex.__init__ = timed_init
+        try:
+            yield self
+        finally:
+            tex_file_writing.compile_tex = original_compile
+            tex_mobject.SingleStringMathTex.__init__ = original_init
+
+
+def measure(builder, repeat: int) -> dict:
+    """Build an object ``1 + repeat`` times and return its construction figures."""
+    cold = Tex_Timer()
+    with cold.installed():
+        mob = builder()
+
+    build_s, tex_s = [], []
+    for _ in range(repeat):
+        warm = Tex_Timer()
+        with warm.installed():
+            start = time.perf_counter()
+            builder()
+            build_s.append(time.perf_counter() - start)
+        tex_s.append(warm.tex_s)
+
+    tracemalloc.start()
+    builder()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    family = mob.get_family()[1:]
+    build_ms = 1e3 * statistics.median(build_s)
+    tex_ms = 1e3 * statistics.median(tex_s)
+    return {
+        "build_ms": round(build_ms, 3),
+        "tex_ms": round(tex_ms, 3),
+        "geometry_ms": round(build_ms - tex_ms, 3),
+        "latex_ms": round(1e3 * cold.latex_s, 3),
+        "latex_runs": cold.latex_runs,
+        "peak_kib": round(peak / 1024, 1),
+        "submobjects": len(family),
+        "bezier_points": sum(len(sub.points) for sub in family),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--templates", nargs="+", default=None, help="Default: all templates."
+    )
+    parser.add_argument("--classes", nargs="+", default=None, help="Default: all.")
+    parser.add_argument("--output", help="JSON file. Default: standard output.")
+    args = parser.parse_args()
+
+    templates = args.templates or available_templates()
+    cases = [case for case in CASES if not args.classes or case[0] in args.classes]
+
+    results = []
+    for template in templates:
+        with get_template(template):
+            for class_name, variant, builder in cases:
+                figures = measure(builder, args.repeat)
+                results.append(
+                    {
+                        "template": template,
+                        "class": class_name,
+                        "variant": variant,
+                        **figures,
+                    }
+                )
+                print(
+                    f"{template:<18}{class_name:<24}{variant:<20}"
+                    f"{figures['build_ms']:>9.1f} ms",
+                    file=sys.stderr,
+                )
+
+    report = {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "manim": manim.__version__,
+            "manim_string_cosmo": __version__,
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
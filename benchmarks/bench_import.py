@@ -0,0 +1,83 @@
+"""
+Import time of :mod:`manim_string_cosmo`, checked against a budget.
+
+Run from the repository root with:
+
+.. code-block:: bash
+
+    python benchmarks/bench_import.py --repeat 5 --budget-ms 50
+
+Each case runs in a fresh interpreter with ``python -X importtime`` and reports the
+total time spent importing modules, start-up modules of Python included (median over
+the repeats). ``bare`` only imports the package, ``templates`` also lists the
+templates (what the command line tools do), ``one class`` resolves a single class
+and ``star`` is the usual ``from manim_string_cosmo import *`` of a scene file. The
+script exits with an error if a case fails to import (with the last line of its
+error), or if ``bare`` or ``templates`` go over the budget.
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+
+CASES = {
+    "bare": "import manim_string_cosmo",
+    "templates": "import manim_string_cosmo; manim_string_cosmo.available_templates()",
+    "one class": "from manim_string_cosmo import Bubble",
+    "star": "from manim_string_cosmo import *",
+}
+
+# Cases that must not pay for manim and the object tree.
+BUDGETED = ["bare", "templates"]
+
+
+def import_time(code: str) -> tuple:
+    """Return the total import time (ms) and the number of modules imported by ``code``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode:
+        lines = result.stderr.splitlines()
+        errors = [line for line in lines if not line.startswith("import time:")]
+        raise RuntimeError(errors[-1] if errors else f"exit status {result.returncode}")
+    # Lines look like "import time:  self [us] | cumulative | imported package".
+    rows = re.findall(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)", result.stderr)
+    total_us = sum(int(cumulative) for _, cumulative, indent, _ in rows if len(indent) == 1)
+    return total_us / 1e3, len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=50)
+    args = parser.parse_args()
+
+    header = f"{'case':<12}{'median ms':>12}{'modules':>10}"
+    print(header)
+    print("-" * len(header))
+    over_budget = []
+    failed = []
+    for case, code in CASES.items():
+        try:
+            runs = [import_time(code) for _ in range(args.repeat)]
+        except RuntimeError as error:
+            print(f"{case:<12}{'failed':>12}  {error}")
+            failed.append(case)
+            continue
+        median = statistics.median(ms for ms, _ in runs)
+        print(f"{case:<12}{median:>12.1f}{runs[0][1]:>10}")
+        if case in BUDGETED and median > args.budget_ms:
+            over_budget.append(case)
+
+    if failed:
+        sys.exit(f"Failed to import: {', '.join(failed)}")
+    if over_budget:
+        sys.exit(f"Over the {args.budget_ms} ms import budget: {', '.join(over_budget)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Build time and memory of :class:`Table_Bh_Embedding` per layout.
+
+Run from the repository root with:
+
+.. code-block:: bash
+
+    python benchmarks/bench_table.py --repeat 20
+
+Each layout only builds its own tables: ``together`` a single table of the nine
+coordinates, ``split`` the non-compact and the compact tables, without copies.
+Labels are compiled once before measuring, so the figures are those of a warm run.
+``mobjects`` counts the mobjects of the table (itself included) and ``tables`` the
+:class:`MobjectTable` objects built for it.
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+
+from manim import MobjectTable
+
+from manim_string_cosmo import Table_Bh_Embedding
+
+LAYOUTS = ["together", "split"]
+
+
+def count_tables(layout: str) -> int:
+    """Return the number of :class:`MobjectTable` built for one table."""
+    original_init = MobjectTable.__init__
+    built = []
+
+    def counting_init(table, *args, **kwargs):
+        built.append(table)
+        original_init(table, *args, **kwargs)
+
+    MobjectTable.__init__ = counting_init
+    try:
+        Table_Bh_Embedding(type=layout)
+    finally:
+        MobjectTable.__init__ = original_init
+    return len(built)
+
+
+def measure(layout: str, repeat: int) -> tuple:
+    """Return the median build time (ms) and peak traced memory (KiB) of one table."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        Table_Bh_Embedding(type=layout)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    Table_Bh_Embedding(type=layout)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return 1e3 * statistics.median(times), peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    # Warm up LaTeX so that only the construction of the table is measured.
+    for layout in LAYOUTS:
+        Table_Bh_Embedding(type=layout)
+
+    header = f"{'layout':<12}{'median ms':>11}{'peak KiB':>11}{'mobjects':>10}{'tables':>8}"
+    print(header)
+    print("-" * len(header))
+    for layout in LAYOUTS:
+        elapsed, peak = measure(layout, args.repeat)
+        mobjects = len(Table_Bh_Embedding(type=layout).get_family())
+        print(
+            f"{layout:<12}{elapsed:>11.2f}{peak:>11.0f}{mobjects:>10}"
+            f"{count_tables(layout):>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,95 @@
-from .figures import *
-from .objects import *
-from .tables_and_plots import *
-from .templates import *
-
-__all__ = []
-__all__ += objects.__all__
-__all__ += tables_and_plots.__all__
-__all__ += templates.__all__
+import importlib
+import os
+
+# Public names are imported on first access (module ``__getattr__``), so that
+# ``import manim_string_cosmo`` does not load manim and the whole package. The
+# subpackages keep re-exporting everything once they are imported.
+
+# Public name -> module that defines it.
+_LAZY_NAMES = {
+    "AdS_Jc": ".objects.ads_jc",
+    "Black_Hole": ".objects.black_hole",
+    "Brane_Circle": ".objects.brane_circle",
+    "Brane_General": ".objects.brane_general",
+    "Bubble": ".objects.bubble",
+    "GW_Emitter": ".objects.gw_emitter",
+    "Level_Of_Detail": ".objects.level_of_detail",
+    "Meter_Bar": ".objects.meter_bar",
+    "Radial_Glow": ".objects.radial_glow",
+    "Radial_Strings": ".objects.radial_strings",
+    "Vacuum_General": ".objects.vacuum_general",
+    "decimate_curve": ".objects.level_of_detail",
+    "update_detail": ".objects.level_of_detail",
+    "Induced_Potential_Family": ".tables_and_plots.induced_potential_family",
+    "Plot_General": ".tables_and_plots.plot_general",
+    "Plot_Induced_Potential": ".tables_and_plots.plot_induced_potential",
+    "Plot_Instanton": ".tables_and_plots.plot_instanton",
+    "Plot_Quantum": ".tables_and_plots.plot_quantum",
+    "Plot_Lambda_Tension": ".tables_and_plots.plot_tension",
+    "Table_Bh_Embedding": ".tables_and_plots.table_bh_embedding",
+    "Table_Energy_Scales": ".tables_and_plots.table_energy_scales",
+    "Table_General": ".tables_and_plots.table_general",
+    "Table_Summary_Induce": ".tables_and_plots.table_summary",
+    "import_template_string_cosmo": ".templates.color_scheme",
+    "Cosmo_Template": ".templates.template",
+    "register_template": ".templates.template",
+    "load_templates": ".templates.template",
+    "get_template": ".templates.template",
+    "available_templates": ".templates.template",
+    "current_template": ".templates.template",
+    "enable_profiling": ".utils.profiling",
+    "disable_profiling": ".utils.profiling",
+    "profiling_records": ".utils.profiling",
+    "profiling_report": ".utils.profiling",
+    "dump_profiling": ".utils.profiling",
+    "profile_objects": ".utils.profiling",
+    "clone": ".utils.prototypes",
+    "prototype": ".utils.prototypes",
+    "clear_prototypes": ".utils.prototypes",
+    "set_prototype_limits": ".utils.prototypes",
+    "prototype_info": ".utils.prototypes",
+    "render_farm": ".utils.render_farm",
+    "svg_asset": ".utils.svg_assets",
+    "clear_svg_assets": ".utils.svg_assets",
+    "collect_tex": ".utils.tex_batch",
+    "compile_tex_batch": ".utils.tex_batch",
+    "prefetch_tex": ".utils.tex_batch",
+    "enable_tex_cache": ".utils.tex_cache",
+    "disable_tex_cache": ".utils.tex_cache",
+    "clear_tex_cache": ".utils.tex_cache",
+    "tex_cache_info": ".utils.tex_cache",
+    "Idle_Updater": ".utils.tracker_bindings",
+    "Watched_Tracker": ".utils.tracker_bindings",
+    "bind_to_tracker": ".utils.tracker_bindings",
+    "unbind_tracker": ".utils.tracker_bindings",
+    "update_tracker_bindings": ".utils.tracker_bindings",
+    "wake_tracker_dependents": ".utils.tracker_bindings",
+}
+
+_SUBPACKAGES = ("figures", "objects", "tables_and_plots", "templates", "utils")
+
+__all__ = list(_LAZY_NAMES)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_NAMES:
+        value = getattr(importlib.import_module(_LAZY_NAMES[name], __name__), name)
+    elif name in _SUBPACKAGES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__) | set(_SUBPACKAGES))
+
+
+# The LaTeX cache has to patch manim before any label is built.
+if os.environ.get("MANIM_STRING_COSMO_TEX_CACHE"):
+    importlib.import_module(".utils.tex_cache", __name__)
+
+# Profiling requested for the whole run (see ``enable_profiling``).
+if os.environ.get("MANIM_STRING_COSMO_PROFILE"):
+    importlib.import_module(".utils.profiling", __name__)
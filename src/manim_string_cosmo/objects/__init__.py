@@ -1,12 +1,24 @@
 from .ads_jc import *
 from .black_hole import *
+from .brane_circle import *
 from .brane_general import *
 from .bubble import *
+from .gw_emitter import *
+from .level_of_detail import *
+from .meter_bar import *
+from .radial_glow import *
+from .radial_strings import *
 from .vacuum_general import *
 
 __all__ = []
 __all__ += ads_jc.__all__
 __all__ += black_hole.__all__
+__all__ += brane_circle.__all__
 __all__ += brane_general.__all__
 __all__ += bubble.__all__
+__all__ += gw_emitter.__all__
+__all__ += level_of_detail.__all__
+__all__ += meter_bar.__all__
+__all__ += radial_glow.__all__
+__all__ += radial_strings.__all__
 __all__ += vacuum_general.__all__
@@ -1,10 +1,12 @@
 from ..my_imports import *
+from .brane_circle import *
 from .brane_general import *
+from .level_of_detail import *
 
 __all__ = ["Black_Hole"]
 
 
-class Black_Hole(Brane_General, VGroup):
+class Black_Hole(Level_Of_Detail, Brane_General, VGroup):
     """
     Create a black hole group that can potentially emit a brane.
 
@@ -13,8 +15,8 @@ class Black_Hole(Brane_General, VGroup):
     spinning black holes. The expanding bubble is always the last (``[-1]``) element
     of the object.
 
-    :param bh_size: Size (radius) of the black hole. Default is ``brane_radius`` from
-        :class:`Brane_General` (typically 1).
+    :param bh_size: Size (radius) of the black hole. Default is the ``brane_radius`` of
+        the object (see :class:`Brane_General`, typically 1).
     :type bh_size: float
 
     :param bh_color: Color of the black hole. Default is ``BLACK``.
@@ -36,6 +38,8 @@ class Black_Hole(Brane_General, VGroup):
 
        The expanding bubble (brane) is always accessible as the last element (``[-1]``) of the object.
        See :class:`Brane_General` for additional inherited parameters.
+       Its circles get the resolution of their size on screen again every time it is
+       scaled (see :class:`Level_Of_Detail`).
 
     **Example usage:**
 
@@ -58,7 +62,7 @@ class Black_Hole(Brane_General, VGroup):
 
     def __init__(
         self,
-        bh_size: float = Brane_General().brane_radius,
+        bh_size: float = None,
         bh_color: ParsableManimColor = BLACK,
         bh_fill_opa: float = 0.8,
         bh_type: str = "none",
@@ -66,21 +70,23 @@ class Black_Hole(Brane_General, VGroup):
     ):
         super().__init__(**kwargs)
         self.bh_type = bh_type
+        if bh_size is None:
+            bh_size = self.brane_radius
         # Geometry
 
-        bh = Circle(
+        bh = Brane_Circle(
             radius=bh_size,
             color=bh_color,
             fill_opacity=bh_fill_opa,
             stroke_width=self.brane_stroke_w,
         ).set_z_index(3)
-        self.brane = Circle(
+        self.brane = Brane_Circle(
             radius=bh_size,
             color=self.brane_color,
             fill_opacity=self.brane_fill_opa,
             stroke_width=1,
         )
-        self.theta_path = Circle(
+        self.theta_path = Brane_Circle(
             radius=bh_size - (bh_size * 3 / 10),
             color=WHITE,
             fill_opacity=0,
@@ -130,7 +136,7 @@ class Black_Hole(Brane_General, VGroup):
         :rtype: AnimationGroup
         """
         return AnimationGroup(
-            self.brane.animate(run_time=rt, rate_func=rf).scale(scaling)
+            self.brane.grow(scaling, run_time=rt, rate_func=rf)
         )
 
     def expand(
@@ -156,11 +162,11 @@ class Black_Hole(Brane_General, VGroup):
         """
         if self.bh_type == "spinning":
             return AnimationGroup(
-                self.brane.animate(run_time=rt, rate_func=rf).scale(scaling),
+                self.brane.grow(scaling, run_time=rt, rate_func=rf),
                 MoveAlongPath(self.theta, self.theta_path, run_time=rt, rate_func=rf),
             )
 
         else:
             return AnimationGroup(
-                self.brane.animate(run_time=rt, rate_func=rf).scale(scaling)
+                self.brane.grow(scaling, run_time=rt, rate_func=rf)
             )
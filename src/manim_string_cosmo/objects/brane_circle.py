@@ -0,0 +1,185 @@
+from typing import Callable
+
+from ..my_imports import *
+from .level_of_detail import *
+
+__all__ = ["Brane_Circle"]
+
+
+class Brane_Circle(Level_Of_Detail, Circle):
+    """
+    Circle whose bezier resolution is chosen from its size on screen.
+
+    A :class:`Circle` always has 8 arcs, whatever its size. A brane circle is
+    described by its centre and radius, read back from its points at any time, and
+    only gets as many arcs (4 at least) as needed to stay within ``tolerance`` pixels
+    of the exact circle at the rendered size. Small circles in grids of thumbnails
+    get the minimum, and the points are generated again with :meth:`set_resolution`
+    every time the circle is scaled (see :class:`Level_Of_Detail`).
+
+    :meth:`grow` scales it with an animation that only interpolates the radius: the
+    points are written from the centre, the radius and cached unit points, at the
+    resolution of the final size, without copying or transforming a starting state.
+
+    :param radius: Radius of the circle. Default is ``1``.
+    :type radius: float
+
+    :param arcs: Number of bezier arcs. Default is ``None``, chosen from the radius
+        with :meth:`arcs_for_radius`.
+    :type arcs: int
+
+    :param tolerance: Largest distance allowed between the arcs and the exact
+        circle, in pixels. Default is ``0.25``.
+    :type tolerance: float
+
+    :param kwargs: Additional keyword arguments passed to :class:`Circle`
+        (e.g. ``color``, ``fill_opacity``, ``stroke_width``).
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        from manim import *
+        from manim_string_cosmo import Brane_Circle
+
+        class Example_Brane_Circle(Scene):
+            def construct(self):
+                brane = Brane_Circle(radius=0.5, color=BLUE, fill_opacity=0.5)
+                self.add(brane)
+                self.play(brane.grow(5, run_time=3))
+    """
+
+    def __init__(
+        self,
+        radius: float = 1,
+        arcs: int = None,
+        tolerance: float = 0.25,
+        **kwargs,
+    ):
+        self.tolerance = tolerance
+        if arcs is None:
+            arcs = self.arcs_for_radius(radius)
+        # Arc scales its unit points to the radius: keep the resolution asked for.
+        self.auto_detail = False
+        super().__init__(radius=radius, num_components=arcs + 1, **kwargs)
+        del self.auto_detail
+
+    def arcs_for_radius(self, radius: float) -> int:
+        """
+        Fewest arcs approximating a circle of this radius within the tolerance.
+
+        A cubic bezier arc of angle ``a`` deviates from the circle by about
+        ``2.7e-4 * radius * (a / (PI / 2)) ** 6``.
+
+        :param radius: Radius of the circle, in scene units.
+        :type radius: float
+
+        :return: Number of arcs, at least 4.
+        :rtype: int
+        """
+        radius_px = abs(radius) * config.pixel_width / config.frame_width
+        arcs = 4 * (2.7e-4 * radius_px / self.tolerance) ** (1 / 6)
+        return max(4, int(np.ceil(arcs)))
+
+    def get_arc_center(self, warning: bool = True) -> np.ndarray:
+        """
+        Centre of the circle, read from its points.
+
+        :param warning: Unused, kept from :meth:`Arc.get_arc_center`.
+        :type warning: bool
+
+        :return: The centre.
+        :rtype: np.ndarray
+        """
+        # The first anchors of the arcs are evenly spread on the circle.
+        return self.points[::4].mean(axis=0)
+
+    def get_radius(self) -> float:
+        """
+        Radius of the circle, read from its points.
+
+        :return: The radius.
+        :rtype: float
+        """
+        return float(np.linalg.norm(self.points[0] - self.get_arc_center()))
+
+    def set_resolution(self, arcs: int = None) -> "Brane_Circle":
+        """
+        Generate the points again with another number of arcs.
+
+        Centre, radius, starting angle and style are kept.
+
+        :param arcs: Number of arcs. Default is ``None``, chosen from the current
+            radius.
+        :type arcs: int
+
+        :return: The circle.
+        :rtype: Brane_Circle
+        """
+        center = self.get_arc_center()
+        radius = self.get_radius()
+        if arcs is None:
+            arcs = self.arcs_for_radius(radius)
+        if arcs == len(self.points) // 4:
+            return self
+        self.start_angle = angle_of_vector(self.points[0] - center)
+        self.num_components = arcs + 1
+        self._set_pre_positioned_points()
+        self.points = center + radius * self.points
+        return self
+
+    def set_detail(self) -> "Brane_Circle":
+        """
+        Use the number of arcs its current radius needs, see :meth:`set_resolution`.
+
+        :return: The circle.
+        :rtype: Brane_Circle
+        """
+        return self.set_resolution()
+
+    def grow(
+        self, factor: float, run_time: float = 1, rate_func: Callable = linear
+    ) -> Animation:
+        """
+        Scale the circle about its centre by ``factor``, interpolating its radius only.
+
+        :param factor: Scaling factor of the radius.
+        :type factor: float
+
+        :param run_time: Run time of the animation. Default is ``1``.
+        :type run_time: float
+
+        :param rate_func: Rate function of the animation. Default is ``linear``.
+        :type rate_func: function
+
+        :return: The animation.
+        :rtype: Animation
+        """
+        return _Radius_Change(self, factor, run_time=run_time, rate_func=rate_func)
+
+
+class _Radius_Change(Animation):
+    # The points of the circle are written from two numbers (start and final radius)
+    # and unit points cached when the animation begins.
+
+    def __init__(self, circle: Brane_Circle, factor: float, **kwargs):
+        super().__init__(circle, **kwargs)
+        self.factor = factor
+
+    def create_starting_mobject(self) -> Mobject:
+        return self.mobject
+
+    def begin(self):
+        circle = self.mobject
+        radius = circle.get_radius()
+        self.final_radius = self.factor * radius
+        circle.set_resolution(circle.arcs_for_radius(max(radius, self.final_radius)))
+        self.center = circle.get_arc_center()
+        self.start_radius = circle.get_radius()
+        self.unit_points = (circle.points - self.center) / self.start_radius
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        alpha = self.rate_func(alpha)
+        radius = interpolate(self.start_radius, self.final_radius, alpha)
+        self.mobject.points[:] = self.center + radius * self.unit_points
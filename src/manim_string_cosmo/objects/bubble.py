@@ -1,13 +1,22 @@
-from os import path
+import warnings
+from functools import cached_property
 
 from ..my_imports import *
+from ..utils.svg_assets import *
+from ..utils.tracker_bindings import *
+from .brane_circle import *
 from .brane_general import *
+from .gw_emitter import *
+from .level_of_detail import *
+from .meter_bar import *
+from .radial_glow import *
+from .radial_strings import *
 from .vacuum_general import *
 
 __all__ = ["Bubble"]
 
 
-class Bubble(Brane_General, Vacuum_General, Group):
+class Bubble(Level_Of_Detail, Brane_General, Vacuum_General, Group):
     """
     Represent Dark Bubble scenarios in 2D with various physical configurations.
 
@@ -39,8 +48,9 @@ class Bubble(Brane_General, Vacuum_General, Group):
     :param string_stroke_w: Stroke width of the strings. Default is ``1.5``.
     :type string_stroke_w: float
 
-    :param field_gradient: Number of gradient layers for the electromagnetic field glow effect.
-        Higher values create smoother gradients. Default is ``50``.
+    :param field_gradient: Deprecated and ignored. It was the number of gradient layers
+        of the former electromagnetic field glow, which is now a single image; use
+        ``glow_resolution`` instead.
     :type field_gradient: float
 
     :param field_top_color: Color of the electromagnetic field on the brane surface.
@@ -51,6 +61,17 @@ class Bubble(Brane_General, Vacuum_General, Group):
         Default is ``PINK``.
     :type field_bulk_color: ParsableManimColor
 
+    :param lazy: If ``True``, only the sub-mobjects needed by ``bubble_type`` are built
+        at construction. The rest (e.g. ``strings``, ``field_glow``, ``mass``) are built
+        the first time they are accessed. If ``False``, everything is built upfront.
+        Default is ``True``.
+    :type lazy: bool
+
+    :param glow_resolution: Resolution, in pixels, of the image of the electromagnetic
+        field glow (see :class:`Radial_Glow`). Higher values create smoother gradients.
+        Default is ``256``.
+    :type glow_resolution: int
+
     :param kwargs: Additional keyword arguments passed to :class:`Brane_General`,
         :class:`Vacuum_General`, and :class:`Group`.
 
@@ -59,6 +80,12 @@ class Bubble(Brane_General, Vacuum_General, Group):
        The bubble (brane) is always the 3rd element (``[2]``) in the internal ``bubble`` group.
        See :class:`Brane_General` and :class:`Vacuum_General` for additional inherited parameters.
 
+    .. tip::
+
+       Scaled down (e.g. to thumbnails in a grid), the bubble draws cheaper versions of
+       its parts: a coarser wobbly brane, a simplified weight figure and circles with
+       fewer arcs. They are chosen again on every ``scale``; see :class:`Level_Of_Detail`.
+
     .. attention::
 
        The ``"em"`` mode currently lacks representation of the B-field in the bulk;
@@ -92,6 +119,29 @@ class Bubble(Brane_General, Vacuum_General, Group):
                 self.play(FadeOut(bub))
     """
 
+    # Sub-mobjects that only some bubble types need. With ``lazy=True`` they are
+    # built the first time they are accessed instead of in ``__init__``.
+    _lazy_assets = (
+        "in_text",
+        "out_text",
+        "in_insta_text",
+        "out_insta_text",
+        "radius_line",
+        "radius_text",
+        "radius_info",
+        "mass",
+        "brane_w_anchor",
+        "strings",
+        "brane_waves",
+        "waves",
+        "field_glow",
+        "field_top",
+        "vacuum_tracker",
+        "bar_outside",
+        "energy_gain",
+        "energy_cost_bubble",
+    )
+
     def __init__(
         self,
         bubble_type: str = "empty",
@@ -99,15 +149,32 @@ class Bubble(Brane_General, Vacuum_General, Group):
         box_width: float = 8,
         string_color: ParsableManimColor = BLUE,
         string_stroke_w: float = 1.5,
-        field_gradient: float = 50,
+        field_gradient: float = None,
         field_top_color: ParsableManimColor = BLUE,
         field_bulk_color: ParsableManimColor = PINK,
+        lazy: bool = True,
+        glow_resolution: int = 256,
         **kwargs,
     ):
         super().__init__(**kwargs)
 
+        if field_gradient is not None:
+            warnings.warn(
+                "Bubble(field_gradient=...) has no effect since the field glow is a "
+                "single image; use glow_resolution to set its smoothness.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
         # Store bubble type for use in animation methods
         self.bubble_type = bubble_type
+        self.box_height = box_height
+        self.box_width = box_width
+        self.string_color = string_color
+        self.string_stroke_w = string_stroke_w
+        self.glow_resolution = glow_resolution
+        self.field_top_color = field_top_color
+        self.field_bulk_color = field_bulk_color
 
         # Geometry Bubbles
         self.background = RoundedRectangle(
@@ -118,170 +185,16 @@ class Bubble(Brane_General, Vacuum_General, Group):
             color=self.vacuum_color,
             fill_opacity=self.vacuum_fill_opa,
         )
-        self.brane = Circle(
+        self.brane = Brane_Circle(
             radius=self.brane_radius,
             color=self.brane_color,
             fill_opacity=1.5 * self.brane_fill_opa,
             stroke_width=self.brane_stroke_w,
         )
 
-        # Text
-        self.in_text = (
-            MathTex("k_{-}", font_size=35, color=self.vacuum_text_color)
-            .move_to(self.background.get_center())
-            .set_z_index(4)
-        )
-        self.out_text = (
-            MathTex("k_{+}", font_size=35, color=self.vacuum_text_color)
-            .move_to(self.background.get_corner(UR) - [0.45, 0.45, 0])
-            .set_z_index(4)
-        )
-
-        self.in_insta_text = (
-            MathTex("V(\\phi_{-})", font_size=35, color=self.vacuum_text_color)
-            .move_to(self.background.get_center())
-            .set_z_index(4)
-        )
-        self.out_insta_text = (
-            MathTex("V(\\phi_{+})", font_size=35, color=self.vacuum_text_color)
-            .move_to(self.background.get_corner(UR) - [0.55, 0.55, 0])
-            .set_z_index(4)
-        )
-        self.radius_line = Line(
-            start=self.brane.get_center(),
-            end=2.5 * self.brane.point_at_angle(PI / 4),
-            color=self.vacuum_text_color,
-            stroke_width=self.brane_stroke_w,
-        )
-        self.radius_text = (
-            MathTex("r=a(\\tau)", font_size=30, color=self.vacuum_text_color)
-            .rotate(PI / 4)
-            .next_to(self.radius_line.get_center(), LEFT, buff=0.05)
-        )
-        self.radius_info = VGroup(self.radius_line, self.radius_text)
-
-        # matter
-        get_mass_path = path.join(path.dirname(__file__), "../figures/weight.svg")
-        self.mass = SVGMobject(get_mass_path).scale(0.5)
-
-        # strings
-        self.strings = VGroup()
-        box_positions = [RIGHT, UR, UP, UL, LEFT, DL, DOWN, DR]
-        dots = VGroup(
-            *[
-                Dot(
-                    radius=0,
-                    fill_opacity=0,
-                    point=self.brane.point_at_angle(i * 360 / 8 * DEGREES),
-                )
-                for i in range(len(box_positions))
-            ]
-        )
-        self.brane_w_anchor = VGroup(dots, self.brane)
-
-        # Create strings with always_redraw for dynamic positioning
-        for angle, position in zip(dots, box_positions):
-            if np.linalg.norm(position) > 1:
-                string = always_redraw(
-                    lambda angle=angle, position=position: Line(
-                        start=angle,
-                        end=self.background.get_corner(position)
-                        - self.cr / 6 * position,
-                        stroke_width=string_stroke_w,
-                        stroke_color=string_color,
-                    )
-                )
-                self.strings.add(string)
-            else:
-                string = always_redraw(
-                    lambda angle=angle, position=position: Line(
-                        start=angle,
-                        end=self.background.get_corner(position),
-                        stroke_width=string_stroke_w,
-                        stroke_color=string_color,
-                    )
-                )
-                self.strings.add(string)
-
-        # Gravitational Waves
-        def func_waves(t):
-            return (
-                (self.brane_radius + 0.01 * np.sin(25 * t)) * np.cos(t),
-                (self.brane_radius + 0.01 * np.sin(25 * t)) * np.sin(t),
-                0,
-            )
-
-        self.brane_waves = ParametricFunction(
-            func_waves,
-            t_range=(0, 2 * TAU),
-            stroke_width=2*self.brane_stroke_w,
-            fill_opacity=self.brane_fill_opa,
-        ).set_color(self.brane_color)
-        self.waves = ParametricFunction(
-            func_waves,
-            t_range=(0, 2 * TAU),
-            stroke_width=self.brane_stroke_w / 3,
-            fill_opacity=0,
-        ).set_color(self.brane_color)
-
-        # Extra Fields - Electromagnetism
-        def field(
-            grad,
-            mobject,
-            rad=self.brane_radius + 0.6,
-            inner_rad=1.05 * self.brane_radius,
-            col=field_top_color,
-        ):
-            glow_group = VGroup()
-            for idx in range(grad):
-                new_circle = Annulus(
-                    inner_radius=inner_rad,
-                    outer_radius=inner_rad + idx / grad * (rad - inner_rad),
-                    stroke_opacity=0,
-                    fill_color=col,
-                    fill_opacity=0.75 / grad,
-                ).move_to(mobject)
-                glow_group.add(new_circle)
-            return glow_group
-
-        self.field_glow = field(field_gradient, self.brane)
-        self.field_top = Circle(
-            radius=1.05 * self.brane_radius,
-            color=field_top_color,
-            fill_opacity=0,
-            stroke_width=4,
-        )
-
-        # Energy Discussion
-        self.vacuum_tracker = ValueTracker(0.8)
-        self.bar_outside = RoundedRectangle(
-            corner_radius=self.corner_rad,
-            height=0.6,
-            width=box_width,
-            stroke_width=self.vacuum_stroke_w + 0.2,
-            color=self.brane_color,
-            fill_opacity=0,
-        )
-        self.bar_outside.next_to(self.background, DOWN, buff=0.2)
-        self.energy_gain = always_redraw(
-            lambda: RoundedRectangle(
-                corner_radius=self.corner_rad,
-                height=0.5,
-                width=self.vacuum_tracker.get_value(),
-                stroke_width=0.1,
-                fill_opacity=self.brane_fill_opa,
-            )
-            .next_to(self.bar_outside.get_left(), aligned_edge=LEFT, buff=0)
-            .set_color(self.bar_outside.get_color())
-        )
-        self.energy_cost_bubble = DashedVMobject(
-            Circle(
-                radius=self.brane_radius,
-                color=self.brane_color,
-                fill_opacity=0,
-                stroke_width=self.vacuum_stroke_w + 0.9,
-            )
-        )
+        if not lazy:
+            for asset in self._lazy_assets:
+                getattr(self, asset)
 
         # Assemble bubble based on type
         if bubble_type == "empty":
@@ -325,7 +238,8 @@ class Bubble(Brane_General, Vacuum_General, Group):
             self.add(self.bubble)
 
         if bubble_type == "em":
-            self.bubble = VGroup(
+            # A Group: the glow is an image.
+            self.bubble = Group(
                 self.background,
                 self.out_text,
                 self.brane,
@@ -346,6 +260,213 @@ class Bubble(Brane_General, Vacuum_General, Group):
             )
             self.add(self.bubble, self.bar_outside, self.in_text, self.energy_gain)
 
+    def set_detail(self) -> "Bubble":
+        """
+        Decimate the wobbly brane and the weight figure for the current size.
+
+        :return: The bubble.
+        :rtype: Bubble
+        """
+        # Circles update themselves. Only parts already built are reduced.
+        if "brane_waves" in self.__dict__:
+            decimate_curve(self.brane_waves, smooth=True)
+        if "mass" in self.__dict__:
+            for part in self.mass.family_members_with_points():
+                decimate_curve(part, segment=2)
+        return self
+
+    # Text
+    @cached_property
+    def in_text(self) -> MathTex:
+        """Inside AdS scale label k₋."""
+        return (
+            MathTex("k_{-}", font_size=35, color=self.vacuum_text_color)
+            .move_to(self.background.get_center())
+            .set_z_index(4)
+        )
+
+    @cached_property
+    def out_text(self) -> MathTex:
+        """Outside AdS scale label k₊."""
+        return (
+            MathTex("k_{+}", font_size=35, color=self.vacuum_text_color)
+            .move_to(self.background.get_corner(UR) - [0.45, 0.45, 0])
+            .set_z_index(4)
+        )
+
+    @cached_property
+    def in_insta_text(self) -> MathTex:
+        """Inside scalar potential label V(φ−)."""
+        return (
+            MathTex("V(\\phi_{-})", font_size=35, color=self.vacuum_text_color)
+            .move_to(self.background.get_center())
+            .set_z_index(4)
+        )
+
+    @cached_property
+    def out_insta_text(self) -> MathTex:
+        """Outside scalar potential label V(φ₊)."""
+        return (
+            MathTex("V(\\phi_{+})", font_size=35, color=self.vacuum_text_color)
+            .move_to(self.background.get_corner(UR) - [0.55, 0.55, 0])
+            .set_z_index(4)
+        )
+
+    @cached_property
+    def radius_line(self) -> Line:
+        """Line from the bubble centre to the brane."""
+        return Line(
+            start=self.brane.get_center(),
+            end=2.5 * self.brane.point_at_angle(PI / 4),
+            color=self.vacuum_text_color,
+            stroke_width=self.brane_stroke_w,
+        )
+
+    @cached_property
+    def radius_text(self) -> MathTex:
+        """Time-dependent radius label r = a(τ)."""
+        return (
+            MathTex("r=a(\\tau)", font_size=30, color=self.vacuum_text_color)
+            .rotate(PI / 4)
+            .next_to(self.radius_line.get_center(), LEFT, buff=0.05)
+        )
+
+    @cached_property
+    def radius_info(self) -> VGroup:
+        """Group of :attr:`radius_line` and :attr:`radius_text`."""
+        return VGroup(self.radius_line, self.radius_text)
+
+    # matter
+    @cached_property
+    def mass(self) -> SVGMobject:
+        """Weight figure representing matter inside the bubble."""
+        return svg_asset("weight").scale(0.5)
+
+    # strings
+    @cached_property
+    def brane_w_anchor(self) -> VGroup:
+        """The brane together with the (invisible) anchor dots of the strings."""
+        dots = VGroup(
+            *[
+                Dot(
+                    radius=0,
+                    fill_opacity=0,
+                    point=self.brane.point_at_angle(i * 360 / 8 * DEGREES),
+                )
+                for i in range(8)
+            ]
+        )
+        return VGroup(dots, self.brane)
+
+    @cached_property
+    def strings(self) -> Radial_Strings:
+        """Strings stretching from the brane to the bulk boundary."""
+        # One updater moves all strings with the anchors, instead of redrawing them.
+        return Radial_Strings(
+            anchors=self.brane_w_anchor[0],
+            frame=self.background,
+            directions=[RIGHT, UR, UP, UL, LEFT, DL, DOWN, DR],
+            corner_inset=self.cr / 6,
+            stroke_width=self.string_stroke_w,
+            stroke_color=self.string_color,
+        )
+
+    # Gravitational Waves
+    def _func_waves(self, t):
+        return (
+            (self.brane_radius + 0.01 * np.sin(25 * t)) * np.cos(t),
+            (self.brane_radius + 0.01 * np.sin(25 * t)) * np.sin(t),
+            0,
+        )
+
+    @cached_property
+    def brane_waves(self) -> ParametricFunction:
+        """Wobbly brane emitting gravitational waves."""
+        return ParametricFunction(
+            self._func_waves,
+            t_range=(0, 2 * TAU),
+            stroke_width=2*self.brane_stroke_w,
+            fill_opacity=self.brane_fill_opa,
+        ).set_color(self.brane_color)
+
+    @cached_property
+    def waves(self) -> GW_Emitter:
+        """Gravitational waves emitted by :meth:`expand_bubble`."""
+        return GW_Emitter(
+            radius=self.brane_radius,
+            amplitude=0.01,
+            frequency=25,
+            n_rings=15,
+            color=self.brane_color,
+            stroke_width=self.brane_stroke_w / 3,
+        )
+
+    # Extra Fields - Electromagnetism
+    @cached_property
+    def field_glow(self) -> Radial_Glow:
+        """Glow of the electromagnetic field around the brane."""
+        # Opacity and falloff reproduce the look of the former 50 stacked annuli.
+        return Radial_Glow(
+            inner_radius=1.05 * self.brane_radius,
+            outer_radius=self.brane_radius + 0.6,
+            color=self.field_top_color,
+            opacity=0.5,
+            falloff=0.75,
+            resolution=self.glow_resolution,
+        ).move_to(self.brane)
+
+    @cached_property
+    def field_top(self) -> Brane_Circle:
+        """Electromagnetic field on the brane surface."""
+        return Brane_Circle(
+            radius=1.05 * self.brane_radius,
+            color=self.field_top_color,
+            fill_opacity=0,
+            stroke_width=4,
+        )
+
+    # Energy Discussion
+    @cached_property
+    def vacuum_tracker(self) -> Watched_Tracker:
+        """Tracker of the vacuum energy shown in the energy bar."""
+        return Watched_Tracker(0.8)
+
+    @cached_property
+    def bar_outside(self) -> RoundedRectangle:
+        """Frame of the energy bar."""
+        return RoundedRectangle(
+            corner_radius=self.corner_rad,
+            height=0.6,
+            width=self.box_width,
+            stroke_width=self.vacuum_stroke_w + 0.2,
+            color=self.brane_color,
+            fill_opacity=0,
+        ).next_to(self.background, DOWN, buff=0.2)
+
+    @cached_property
+    def energy_gain(self) -> Meter_Bar:
+        """Filling of the energy bar, driven by :attr:`vacuum_tracker`."""
+        return Meter_Bar(
+            self.vacuum_tracker,
+            self.bar_outside,
+            height=0.5,
+            corner_radius=self.corner_rad,
+            stroke_width=0.1,
+            fill_opacity=self.brane_fill_opa,
+        ).set_color(self.bar_outside.get_color())
+
+    @cached_property
+    def energy_cost_bubble(self) -> DashedVMobject:
+        """Dashed circle showing the energy cost of nucleating the bubble."""
+        return DashedVMobject(
+            Brane_Circle(
+                radius=self.brane_radius,
+                color=self.brane_color,
+                fill_opacity=0,
+                stroke_width=self.vacuum_stroke_w + 0.9,
+            )
+        )
+
     def fade_in_bulk(
         self, rt: float = 1, rf: float = linear
     ) -> Animation:
@@ -443,7 +564,7 @@ class Bubble(Brane_General, Vacuum_General, Group):
                 FadeIn(self.bubble[3:-2], run_time=rt, rate_function=rt),
                 Create(self.field_top, run_time=rt, rate_function=rf),
                 Wait(),
-                Create(self.field_glow, run_time=2 * rt, rate_func=rf),
+                FadeIn(self.field_glow, run_time=2 * rt, rate_func=rf),
             )
 
         if self.bubble_type == "strings":
@@ -495,27 +616,22 @@ class Bubble(Brane_General, Vacuum_General, Group):
                 self.vacuum_tracker.animate(run_time=rt / 3, rate_func=rf).set_value(
                     4.5
                 ),
-                self.bubble[3].animate(run_time=rt, rate_func=rf).scale(sca),
+                self.bubble[3].grow(sca, run_time=rt, rate_func=rf),
             )
 
         if self.bubble_type == "GW":
             return AnimationGroup(
                 self.brane_waves.animate(run_time=rt, rate_func=rf).scale(sca),
-                Broadcast(
-                    self.waves.scale(0.6 * sca),
-                    focal_point=self.bubble[2].get_center(),
-                    initial_opacity=1,
-                    final_opacity=0,
-                    n_mobs=15,
-                    run_time=rt,
-                    rate_func=rf,
+                self.waves.scale(0.6 * sca).emit(
+                    focal_point=self.bubble[2].get_center(), run_time=rt, rate_func=rf
                 ),
             )
 
         if self.bubble_type == "em":
             return AnimationGroup(
-                self.brane.animate(run_time=rt, rate_func=rf).scale(0.8 * sca),
-                self.bubble[-2:].animate(run_time=rt, rate_func=rf).scale(0.8 * sca),
+                self.brane.grow(0.8 * sca, run_time=rt, rate_func=rf),
+                self.field_top.grow(0.8 * sca, run_time=rt, rate_func=rf),
+                self.field_glow.animate(run_time=rt, rate_func=rf).scale(0.8 * sca),
             )
 
         if self.bubble_type == "strings":
@@ -524,9 +640,7 @@ class Bubble(Brane_General, Vacuum_General, Group):
             )
 
         else:
-            return AnimationGroup(
-                self.brane.animate(run_time=rt, rate_func=rf).scale(sca)
-            )
+            return AnimationGroup(self.brane.grow(sca, run_time=rt, rate_func=rf))
 
     def show_radius(self, rt: float = 1, rf: float = linear) -> Succession:
         """
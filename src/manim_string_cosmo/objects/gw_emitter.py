@@ -0,0 +1,244 @@
+from typing import Callable
+
+from ..my_imports import *
+from .level_of_detail import *
+
+__all__ = ["GW_Emitter"]
+
+
+class GW_Emitter(Level_Of_Detail, VGroup):
+    """
+    Rings of gravitational waves emitted from a point, growing and fading out.
+
+    It gives the look of manim's :class:`Broadcast` over a rippled circle, at a fraction
+    of the cost. The ripple ``(radius + amplitude * sin(frequency * t))`` is sampled
+    once, over a single turn, with just enough points for ``tolerance``. Every ring
+    holds its own copy of these points. During :meth:`emit`, the points of each ring
+    are rewritten in place as a scaling of the shared ripple, instead of
+    interpolating full copies of a mobject.
+
+    At rest the rings have the final opacity (invisible by default), as the copies of
+    :class:`Broadcast` before they are emitted.
+
+    When scaled, the ripple is sampled again for the size of the rings on screen: the
+    tolerance is loosened to ``pixel_tolerance`` pixels (``0.25`` by default) when
+    that is coarser than ``tolerance``. See :class:`Level_Of_Detail`.
+
+    :param radius: Radius of the ripple, the size the rings grow to. Default is ``1``.
+    :type radius: float
+
+    :param amplitude: Amplitude of the ripples. Default is ``0.01``.
+    :type amplitude: float
+
+    :param frequency: Number of ripples along the ring. Default is ``25``.
+    :type frequency: int
+
+    :param n_rings: Number of rings emitted. Default is ``15``.
+    :type n_rings: int
+
+    :param lag_ratio: Delay between two rings, as a fraction of the growth of one ring.
+        Default is ``0.2``.
+    :type lag_ratio: float
+
+    :param initial_opacity: Stroke opacity of a ring when emitted. Default is ``1``.
+    :type initial_opacity: float
+
+    :param final_opacity: Stroke opacity of a ring at full size. Default is ``0``.
+    :type final_opacity: float
+
+    :param tolerance: Largest distance allowed between a ring and the exact ripple,
+        at full size, before smoothing. Default is ``0.001``.
+    :type tolerance: float
+
+    :param color: Color of the rings. Default is ``WHITE``.
+    :type color: ParsableManimColor
+
+    :param stroke_width: Stroke width of the rings. Default is ``1``.
+    :type stroke_width: float
+
+    :param kwargs: Additional keyword arguments passed to :class:`VGroup`.
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        from manim import *
+        from manim_string_cosmo import GW_Emitter
+
+        class Example_GW_Emitter(Scene):
+            def construct(self):
+                source = Circle(radius=0.5, color=BLUE)
+                waves = GW_Emitter(radius=3, amplitude=0.02, n_rings=10, color=BLUE)
+                self.add(source)
+                self.play(waves.emit(run_time=4), source.animate.scale(2))
+    """
+
+    pixel_tolerance = 0.25
+
+    def __init__(
+        self,
+        radius: float = 1,
+        amplitude: float = 0.01,
+        frequency: int = 25,
+        n_rings: int = 15,
+        lag_ratio: float = 0.2,
+        initial_opacity: float = 1,
+        final_opacity: float = 0,
+        tolerance: float = 0.001,
+        color: ParsableManimColor = WHITE,
+        stroke_width: float = 1,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.radius = radius
+        self.amplitude = amplitude
+        self.frequency = frequency
+        self.lag_ratio = lag_ratio
+        self.initial_opacity = initial_opacity
+        self.final_opacity = final_opacity
+        self.tolerance = tolerance
+
+        ripple = VMobject().set_points_smoothly(self.ripple_samples(tolerance)).points
+        self.add(
+            *[
+                VMobject(
+                    stroke_color=color,
+                    stroke_width=stroke_width,
+                    stroke_opacity=final_opacity,
+                    fill_opacity=0,
+                ).set_points(ripple)
+                for _ in range(n_rings)
+            ]
+        )
+
+    def ripple_samples(self, tolerance: float) -> np.ndarray:
+        """
+        Sample one closed turn of the ripple, with as few points as allowed.
+
+        Both the ripples and the circle itself are sampled finely enough for their
+        chords to stay within ``tolerance`` of them.
+
+        :param tolerance: Largest distance allowed between the chords and the ripple.
+        :type tolerance: float
+
+        :return: Array of shape ``(n, 3)``, centred on the origin.
+        :rtype: np.ndarray
+        """
+
+        def samples_per_turn(radius: float) -> int:
+            # Chords of an arc of radius r over an angle a deviate by r(1 - cos(a/2)).
+            if radius <= tolerance:
+                return 2
+            return int(np.ceil(PI / np.arccos(1 - tolerance / radius)))
+
+        n = max(
+            self.frequency * samples_per_turn(self.amplitude),
+            samples_per_turn(self.radius),
+            8,
+        )
+        t = np.linspace(0, TAU, n + 1)
+        r = self.radius + self.amplitude * np.sin(self.frequency * t)
+        return np.stack([r * np.cos(t), r * np.sin(t), np.zeros_like(t)], axis=1)
+
+    def set_detail(self) -> "GW_Emitter":
+        """
+        Sample the ripple of the rings again for their current size on screen.
+
+        The tolerance used is the larger of ``tolerance`` and ``pixel_tolerance``
+        pixels on screen.
+
+        :return: The emitter.
+        :rtype: GW_Emitter
+        """
+        # Size and orientation are read from the first anchor of a ring at rest, where
+        # the ripple is at ``radius``.
+        ring = self[0].points
+        center = ring[::4].mean(axis=0)
+        offset = ring[0] - center
+        scale = np.linalg.norm(offset) / self.radius
+        if scale == 0:
+            return self
+        tolerance = max(
+            self.tolerance,
+            self.pixel_tolerance * config.frame_width / config.pixel_width / scale,
+        )
+        samples = self.ripple_samples(tolerance)
+        if len(samples) - 1 == len(ring) // 4:
+            return self
+
+        ripple = VMobject().set_points_smoothly(samples).points
+        ripple = ripple @ rotation_matrix(angle_of_vector(offset), OUT).T
+        for sub in self.submobjects:
+            sub.set_points(center + scale * ripple)
+        return self
+
+    def emit(
+        self,
+        focal_point: np.ndarray = None,
+        run_time: float = 3,
+        rate_func: Callable = linear,
+    ) -> Animation:
+        """
+        Emit the rings from ``focal_point``, one after the other.
+
+        Each ring grows from a point to its full size, with the timing of the
+        rings of :class:`Broadcast`. The emitter leaves the scene at the end.
+
+        :param focal_point: Point the rings grow from. Default is the centre of the
+            emitter.
+        :type focal_point: np.ndarray
+
+        :param run_time: Run time of the animation. Default is ``3``.
+        :type run_time: float
+
+        :param rate_func: Rate function of the whole emission. Default is ``linear``.
+        :type rate_func: function
+
+        :return: The emission.
+        :rtype: Animation
+        """
+        return _GW_Emission(
+            self, focal_point=focal_point, run_time=run_time, rate_func=rate_func
+        )
+
+
+class _GW_Emission(Animation):
+    # Rings are placed directly from the ripple: no starting copy of the emitter is
+    # made and no submobject is interpolated.
+
+    def __init__(self, emitter: GW_Emitter, focal_point: np.ndarray = None, **kwargs):
+        super().__init__(emitter, remover=True, **kwargs)
+        self.focal_point = focal_point
+
+    def create_starting_mobject(self) -> Mobject:
+        return self.mobject
+
+    def begin(self):
+        emitter = self.mobject
+        self.center = emitter.get_center()
+        self.ripple = emitter[0].points - self.center
+        if self.focal_point is None:
+            self.origin = self.center
+        else:
+            self.origin = np.array(self.focal_point)
+        n_rings = len(emitter)
+        self.starts = emitter.lag_ratio * np.arange(n_rings)
+        self.total = 1 + emitter.lag_ratio * (n_rings - 1)
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        emitter = self.mobject
+        times = np.clip(self.rate_func(alpha) * self.total - self.starts, 0, 1)
+        opacities = (emitter.initial_opacity, emitter.final_opacity)
+        for ring, time in zip(emitter.submobjects, times):
+            size = smooth(time)
+            ring.points[:] = self.origin + size * self.ripple
+            ring.set_stroke(opacity=interpolate(*opacities, size))
+
+    def clean_up_from_scene(self, scene: Scene):
+        super().clean_up_from_scene(scene)
+        # Back to rest: full size around the emitter, at the final opacity.
+        emitter = self.mobject
+        for ring in emitter.submobjects:
+            ring.points[:] = self.center + self.ripple
+            ring.set_stroke(opacity=emitter.final_opacity)
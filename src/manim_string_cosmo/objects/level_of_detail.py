@@ -0,0 +1,227 @@
+from ..my_imports import *
+
+__all__ = ["Level_Of_Detail", "update_detail", "decimate_curve"]
+
+
+# Strides of the anchors kept by :func:`decimate_curve`. Anchors whose index is a
+# multiple of the largest one are kept at every level of detail.
+_STRIDES = (1, 2, 4, 8)
+
+
+def _pixels_per_unit() -> float:
+    return config.pixel_width / config.frame_width
+
+
+class Level_Of_Detail:
+    """
+    Mixin for objects that choose a cheaper representation when small on screen.
+
+    A class using it implements :meth:`set_detail`, which reads the current size of
+    the object and updates its parts to the detail that size needs (coarser sampling
+    of curves, circles with fewer arcs, simplified figures, ...). It is called again
+    every time the object is scaled (``scale``, ``scale_to_fit_width``, ...,
+    ``.animate.scale`` included), for every member of its family using the mixin.
+
+    Scaling a plain :class:`Group` holding such objects does not go through their
+    ``scale``: call :func:`update_detail` on the group afterwards.
+
+    Set ``auto_detail = False`` on a class (or an instance) to keep its full detail
+    whatever its size.
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        from manim import *
+        from manim_string_cosmo import *
+
+        class Example_Level_Of_Detail(Scene):
+            def construct(self):
+                # Each bubble reduces its curves and figure when scaled down.
+                types = ["GW", "radiation", "em"]
+                bubbles = Group(*[Bubble(bubble_type=t).scale(0.3) for t in types])
+                holes = Group(*[Black_Hole() for _ in range(3)]).arrange(RIGHT)
+                update_detail(holes.scale_to_fit_width(4))
+                self.add(Group(bubbles.arrange(RIGHT), holes).arrange(DOWN))
+    """
+
+    auto_detail = True
+
+    def get_pixel_width(self) -> float:
+        """
+        Width of the object once rendered, in pixels.
+
+        :return: The width.
+        :rtype: float
+        """
+        return self.width * _pixels_per_unit()
+
+    def set_detail(self) -> "Level_Of_Detail":
+        """
+        Update the parts of the object to the detail its current size needs.
+
+        :return: The object.
+        :rtype: Level_Of_Detail
+        """
+        return self
+
+    def scale(self, scale_factor: float, **kwargs) -> "Level_Of_Detail":
+        """
+        Scale the object, then update it to the detail of its new size.
+
+        :param scale_factor: Scaling factor.
+        :type scale_factor: float
+
+        :param kwargs: Additional keyword arguments passed to :meth:`Mobject.scale`.
+
+        :return: The object.
+        :rtype: Level_Of_Detail
+        """
+        super().scale(scale_factor, **kwargs)
+        if self.auto_detail and scale_factor != 0:
+            update_detail(self)
+        return self
+
+
+def update_detail(mob: Mobject) -> Mobject:
+    """
+    Update every object of the family of ``mob`` to the detail of its current size.
+
+    :param mob: Object or group of objects using :class:`Level_Of_Detail`.
+    :type mob: Mobject
+
+    :return: The same ``mob``.
+    :rtype: Mobject
+    """
+    for sub in mob.get_family():
+        if isinstance(sub, Level_Of_Detail) and sub.auto_detail:
+            sub.set_detail()
+    return mob
+
+
+def decimate_curve(
+    vmob: VMobject, segment: float = 3, smooth: bool = False
+) -> VMobject:
+    """
+    Keep only part of the anchors of a curve, according to its size on screen.
+
+    The anchors kept make segments about ``segment`` pixels long. The first call
+    stores the points of ``vmob`` as its full detail. Every call then rebuilds the
+    curve where it currently is (shifted, rotated and scaled since): at full detail
+    from the stored points themselves, handles included, and otherwise from one
+    stored anchor every 2, 4 or 8. Going down and up in detail thus never
+    accumulates errors. The first and last anchors of every subpath are always kept,
+    and closed subpaths stay closed.
+
+    If the points were changed otherwise in between (e.g. aligned by an animation),
+    the current points become the full detail. Reflections of the curve since the
+    first call are not followed.
+
+    :param vmob: Curve to reduce, without submobjects.
+    :type vmob: VMobject
+
+    :param segment: Target length of the segments, in pixels. Default is ``3``.
+    :type segment: float
+
+    :param smooth: If ``True``, the kept anchors are joined smoothly (for sampled
+        curves such as :class:`ParametricFunction`), else by straight lines (for
+        figures with corners). Default is ``False``.
+    :type smooth: bool
+
+    :return: The same ``vmob``.
+    :rtype: VMobject
+    """
+    source = vmob.__dict__.get("_lod_source")
+    if source is None or len(vmob.points) != source["lengths"][source["stride"]]:
+        source = _curve_source(vmob)
+        vmob._lod_source = source
+    if source["reference"] is None:
+        return vmob
+
+    # Where the two reference anchors of the source are now.
+    current = [
+        vmob.points[_point_index(source, source["stride"], ref)]
+        for ref in source["reference"]
+    ]
+    origin, end = (source["anchors"][i][j] for i, j in source["reference"])
+    ratio = complex(*(current[1] - current[0])[:2]) / complex(*(end - origin)[:2])
+    if abs(ratio) == 0:
+        return vmob
+
+    spacing = abs(ratio) * source["spacing"] * _pixels_per_unit()
+    stride = max(s for s in _STRIDES if s == 1 or s * spacing <= segment)
+    if stride == source["stride"]:
+        return vmob
+
+    def place(points: np.ndarray) -> np.ndarray:
+        # Similarity mapping the source reference anchors to the current ones.
+        plane = complex(*current[0][:2]) + ratio * (
+            (points[:, 0] - origin[0]) + 1j * (points[:, 1] - origin[1])
+        )
+        return np.stack(
+            [plane.real, plane.imag, points[:, 2] + current[0][2] - origin[2]], axis=1
+        )
+
+    if stride == 1:
+        # Full detail: the original curve itself, handles included.
+        vmob.set_points(place(source["points"]))
+    else:
+        vmob.clear_points()
+        for anchors in source["anchors"]:
+            placed = place(_kept_anchors(anchors, stride))
+            vmob.start_new_path(placed[0])
+            vmob.add_points_as_corners(placed[1:])
+        if smooth:
+            vmob.make_smooth()
+    source["stride"] = stride
+    return vmob
+
+
+def _curve_source(vmob: VMobject) -> dict:
+    # Anchors of every subpath, and the two anchors used to locate the curve: the
+    # start of the first subpath, and an anchor kept at every stride further along
+    # it (or the start of the second subpath).
+    anchors = [
+        np.vstack([path[::4], path[-1:]])
+        for path in vmob.get_subpaths_from_points(vmob.points)
+    ]
+    source = {
+        "points": vmob.points.copy(),
+        "anchors": anchors,
+        "stride": 1,
+        "lengths": {
+            stride: 4 * sum(len(_kept_anchors(a, stride)) - 1 for a in anchors)
+            for stride in _STRIDES
+        },
+        "reference": None,
+    }
+    if not anchors:
+        return source
+    segments = sum(len(a) - 1 for a in anchors)
+    length = sum(np.linalg.norm(np.diff(a, axis=0), axis=1).sum() for a in anchors)
+    source["spacing"] = length / segments
+
+    step = _STRIDES[-1]
+    along = step * ((len(anchors[0]) - 1) // (2 * step))
+    if along > 0:
+        source["reference"] = ((0, 0), (0, along))
+    elif len(anchors) > 1:
+        source["reference"] = ((0, 0), (1, 0))
+    return source
+
+
+def _kept_anchors(anchors: np.ndarray, stride: int) -> np.ndarray:
+    kept = anchors[::stride]
+    if (len(anchors) - 1) % stride:
+        kept = np.vstack([kept, anchors[-1:]])
+    return kept
+
+
+def _point_index(source: dict, stride: int, reference: tuple) -> int:
+    # Index in the points of the curve, decimated by ``stride``, of a source anchor
+    # kept at every stride.
+    path, anchor = reference
+    start = sum(
+        4 * (len(_kept_anchors(a, stride)) - 1) for a in source["anchors"][:path]
+    )
+    return start + 4 * (anchor // stride)
@@ -0,0 +1,114 @@
+from ..my_imports import *
+from ..utils.tracker_bindings import Idle_Updater, Watched_Tracker
+
+__all__ = ["Meter_Bar"]
+
+
+class Meter_Bar(VMobject):
+    """
+    Progress bar growing from the left edge of a frame, its length read from a tracker.
+
+    The bar is built once. When the tracker value (or the frame) changes, its points are
+    rewritten in place: the rounded ends are translated and the straight sides are
+    stretched, so corners never get distorted. When nothing changed, the updater
+    returns without touching the points, and with a :class:`Watched_Tracker` it is
+    taken off the bar until the value changes (the bar then no longer counts as
+    moving in animations that do not concern it).
+
+    :param tracker: Tracker holding the length of the bar, measured in the units of the
+        frame as it was when the bar was created.
+    :type tracker: ValueTracker
+
+    :param frame: Mobject whose left edge holds the bar, usually its outline. The bar
+        follows it when it is moved or scaled.
+    :type frame: Mobject
+
+    :param height: Height of the bar. Default is ``0.5``.
+    :type height: float
+
+    :param corner_radius: Corner radius of the bar, a number or a list of four numbers
+        as in :class:`RoundedRectangle`. Default is ``0``.
+    :type corner_radius: float or list
+
+    :param kwargs: Additional keyword arguments passed to :class:`VMobject`
+        (e.g. ``fill_opacity``, ``stroke_width``).
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        from manim import *
+        from manim_string_cosmo import Meter_Bar
+
+        class Example_Meter_Bar(Scene):
+            def construct(self):
+                budget = ValueTracker(1)
+                outline = RoundedRectangle(corner_radius=0.1, height=0.6, width=6)
+                bar = Meter_Bar(budget, outline, corner_radius=0.1, fill_opacity=0.6)
+                self.add(outline, bar)
+                self.play(budget.animate.set_value(5))
+    """
+
+    def __init__(
+        self,
+        tracker: ValueTracker,
+        frame: Mobject,
+        height: float = 0.5,
+        corner_radius: float = 0,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.tracker = tracker
+        self.frame = frame
+        self._frame_width = frame.width
+        self._last_state = None
+
+        # Template of the bar with its left edge at x = 0, long enough for both ends.
+        self._end_length = float(np.max(corner_radius))
+        self._template_width = 2 * self._end_length + 1
+        template = RoundedRectangle(
+            corner_radius=corner_radius, height=height, width=self._template_width
+        )
+        self._template = template.points - template.get_left()
+
+        self.set_points(self._template)
+        self.idle_updater = Idle_Updater(self, Meter_Bar.update_bar)
+        self.update_bar()
+        self.add_updater(Meter_Bar.update_bar)
+
+    def update_bar(self) -> "Meter_Bar":
+        """
+        Resize the bar to the tracker value, if the value or the frame changed.
+
+        :return: The bar.
+        :rtype: Meter_Bar
+        """
+        value = max(self.tracker.get_value(), 0)
+        left = self.frame.get_left()
+        scale = self.frame.width / self._frame_width
+        state = (value, scale, *left)
+        if state == self._last_state:
+            if isinstance(self.tracker, Watched_Tracker):
+                self.idle_updater.sleep(self.tracker)
+            return self
+        self._last_state = state
+
+        x = self._template[:, 0]
+        ends = self._end_length
+        width = self._template_width
+        if value >= 2 * ends:
+            # Left end kept, right end translated, straight sides stretched.
+            middle = ends + (x - ends) * (value - 2 * ends) / (width - 2 * ends)
+            right = x - width + value
+            new_x = np.where(x <= ends, x, np.where(x >= width - ends, right, middle))
+        else:
+            new_x = x * value / width
+
+        points = self._template.copy()
+        points[:, 0] = new_x
+        points = left + scale * points
+        if self.points.shape == points.shape:
+            self.points[:] = points
+        else:
+            self.set_points(points)
+        return self
@@ -0,0 +1,89 @@
+from ..my_imports import *
+
+__all__ = ["Radial_Glow"]
+
+
+def _glow_texture(
+    inner_ratio: float,
+    color: ParsableManimColor,
+    opacity: float,
+    falloff: float,
+    size: int,
+) -> np.ndarray:
+    # RGBA pixels of the glow, with the outer radius touching the edges of the image.
+    coords = 2 * (np.arange(size) + 0.5) / size - 1
+    t = (np.hypot(*np.meshgrid(coords, coords)) - inner_ratio) / (1 - inner_ratio)
+    alpha = np.where((t >= 0) & (t <= 1), opacity * np.clip(1 - t, 0, 1) ** falloff, 0)
+    texture = np.empty((size, size, 4), dtype=np.uint8)
+    texture[..., :3] = ManimColor(color).to_int_rgb()
+    texture[..., 3] = np.round(255 * alpha)
+    return texture
+
+
+class Radial_Glow(ImageMobject):
+    """
+    Radial glow around a circular object, fading out from an inner to an outer radius.
+
+    The glow is a single image, computed once from the falloff profile, so every pixel
+    of it is composited a single time per frame, and the gradient is smooth at any
+    size. It can be scaled, moved and faded like any :class:`ImageMobject`, and put
+    in a :class:`Group` (not in a :class:`VGroup`).
+
+    :param inner_radius: Radius where the glow starts (at full ``opacity``). Default is ``1``.
+    :type inner_radius: float
+
+    :param outer_radius: Radius where the glow has faded out completely. Default is ``1.6``.
+    :type outer_radius: float
+
+    :param color: Color of the glow. Default is ``BLUE``.
+    :type color: ParsableManimColor
+
+    :param opacity: Opacity at the inner radius. Default is ``0.5``.
+    :type opacity: float
+
+    :param falloff: Exponent of the profile ``opacity * (1 - t) ** falloff``, where ``t``
+        goes from 0 (inner radius) to 1 (outer radius). ``1`` is a linear fade, smaller
+        values keep the glow bright for longer. Default is ``1``.
+    :type falloff: float
+
+    :param resolution: Width and height of the image, in pixels. It is resampled to
+        its size on screen when rendered. Default is ``256``.
+    :type resolution: int
+
+    :param kwargs: Additional keyword arguments passed to :class:`ImageMobject`.
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        from manim import *
+        from manim_string_cosmo import Radial_Glow
+
+        class Example_Radial_Glow(Scene):
+            def construct(self):
+                core = Circle(radius=1, color=YELLOW)
+                glow = Radial_Glow(inner_radius=1, outer_radius=2, color=YELLOW, falloff=0.7)
+                self.play(GrowFromCenter(core), FadeIn(glow))
+                self.play(Group(core, glow).animate.scale(1.5))
+    """
+
+    def __init__(
+        self,
+        inner_radius: float = 1,
+        outer_radius: float = 1.6,
+        color: ParsableManimColor = BLUE,
+        opacity: float = 0.5,
+        falloff: float = 1,
+        resolution: int = 256,
+        **kwargs,
+    ):
+        self.inner_radius = inner_radius
+        self.outer_radius = outer_radius
+        self.glow_color = color
+        self.glow_opacity = opacity
+        self.falloff = falloff
+        texture = _glow_texture(
+            inner_radius / outer_radius, color, opacity, falloff, resolution
+        )
+        super().__init__(texture, **kwargs)
+        self.scale_to_fit_height(2 * outer_radius)
@@ -0,0 +1,124 @@
+from ..my_imports import *
+
+__all__ = ["Radial_Strings"]
+
+
+class Radial_Strings(VGroup):
+    """
+    Straight strings stretched between some anchors and the edges of a frame.
+
+    String ``i`` goes from the centre of ``anchors[i]`` to the point of the bounding box
+    of ``frame`` in direction ``directions[i]`` (a corner for diagonal directions, the
+    middle of an edge otherwise). A single updater recomputes all endpoints at once
+    with NumPy and writes them into the existing strings, and only when an anchor or
+    the frame has actually moved.
+
+    :param anchors: Mobjects where the strings start, one per string.
+    :type anchors: VGroup
+
+    :param frame: Mobject whose bounding box holds the other end of the strings.
+    :type frame: Mobject
+
+    :param directions: One direction per string, e.g. ``[RIGHT, UR, UP]``.
+    :type directions: list
+
+    :param corner_inset: Distance to pull the strings ending in a corner back along
+        their direction, e.g. to end on a rounded corner. Default is ``0``.
+    :type corner_inset: float
+
+    :param stroke_width: Stroke width of the strings. Default is ``1.5``.
+    :type stroke_width: float
+
+    :param stroke_color: Color of the strings. Default is ``BLUE``.
+    :type stroke_color: ParsableManimColor
+
+    :param kwargs: Additional keyword arguments passed to :class:`VGroup`.
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        from manim import *
+        from manim_string_cosmo import Radial_Strings
+
+        class Example_Radial_Strings(Scene):
+            def construct(self):
+                box = Rectangle(width=8, height=6)
+                brane = Circle()
+                directions = [RIGHT, UP, LEFT, DOWN]
+                anchors = VGroup(*[Dot(brane.point_at_angle(i * PI / 2), radius=0) for i in range(4)])
+                strings = Radial_Strings(anchors, box, directions)
+                self.add(box, brane, anchors, strings)
+                self.play(VGroup(brane, anchors).animate.scale(2))
+    """
+
+    # Bezier parameters of the two anchors and two handles of a straight segment.
+    _line_t = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+
+    def __init__(
+        self,
+        anchors: VGroup,
+        frame: Mobject,
+        directions: list,
+        corner_inset: float = 0,
+        stroke_width: float = 1.5,
+        stroke_color: ParsableManimColor = BLUE,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.anchors = anchors
+        self.frame = frame
+        self.directions = np.array(directions, dtype=float)
+        is_corner = np.linalg.norm(self.directions, axis=1) > 1
+        self.insets = corner_inset * self.directions * is_corner[:, None]
+        self._last_ends = None
+
+        self.add(
+            *[
+                Line(stroke_width=stroke_width, stroke_color=stroke_color)
+                for _ in self.directions
+            ]
+        )
+        self.update_strings()
+        self.add_updater(Radial_Strings.update_strings)
+
+    def get_string_ends(self) -> np.ndarray:
+        """
+        Compute the start and end point of every string.
+
+        :return: Array of shape ``(n_strings, 2, 3)`` with the start and end points.
+        :rtype: np.ndarray
+        """
+        points = [anchor.get_all_points() for anchor in self.anchors]
+        offsets = np.cumsum([0] + [len(p) for p in points[:-1]])
+        all_points = np.concatenate(points)
+        starts = (
+            np.minimum.reduceat(all_points, offsets)
+            + np.maximum.reduceat(all_points, offsets)
+        ) / 2
+
+        frame_points = self.frame.get_all_points()
+        low, high = frame_points.min(axis=0), frame_points.max(axis=0)
+        ends = (low + high) / 2 + self.directions * (high - low) / 2 - self.insets
+        return np.stack([starts, ends], axis=1)
+
+    def update_strings(self) -> "Radial_Strings":
+        """
+        Move the strings to their anchors, if any of them has moved since the last call.
+
+        :return: The strings.
+        :rtype: Radial_Strings
+        """
+        ends = self.get_string_ends()
+        if self._last_ends is not None and np.array_equal(ends, self._last_ends):
+            return self
+        self._last_ends = ends
+
+        starts, stops = ends[:, :1], ends[:, 1:]
+        all_points = starts + self._line_t * (stops - starts)
+        for string, points in zip(self.submobjects, all_points):
+            if string.points.shape == points.shape:
+                string.points[:] = points
+            else:
+                string.set_points(points)
+        return self
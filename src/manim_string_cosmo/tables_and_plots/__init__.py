@@ -1,3 +1,4 @@
+from .induced_potential_family import *
 from .plot_general import *
 from .plot_induced_potential import *
 from .plot_instanton import *
@@ -13,6 +14,7 @@ __all__ += plot_general.__all__
 __all__ += table_general.__all__
 __all__ += plot_instanton.__all__
 __all__ += plot_induced_potential.__all__
+__all__ += induced_potential_family.__all__
 __all__ += plot_quantum.__all__
 __all__ += plot_tension.__all__
 __all__ += table_summary.__all__
@@ -0,0 +1,130 @@
+from typing import Callable
+
+from ..my_imports import *
+
+__all__ = ["Induced_Potential_Family"]
+
+
+class Induced_Potential_Family:
+    r"""
+    Family of 4D potentials :math:`V(a; J, \Lambda)` induced on a brane nucleated in 10D.
+
+    Every member of the family shares the horizon term and the pieces of the flux term
+    that do not depend on the junction parameter :math:`J`. :meth:`evaluate` computes
+    them once for all the variants it evaluates on the same scale factors, so each
+    further variant only costs a few extra array operations.
+    :meth:`Plot_Induced_Potential.plot_variants` samples its curves this way.
+
+    .. math::
+
+        V(a) = A \left[ \frac{(a_H^2 - a^2)(a_h^2 - a^2)(a_H^2 + a_h^2 + 1 + a^2)}{a^4}
+        - \frac{\left(a^4 - a_H^4 + \frac{J}{a_H}\sqrt{a_H^2 + a_h^2 + 1}
+        \left(1 - \frac{a_H^2}{a^2}\right)\right)^2}{J^2 + a^6}
+        - \Lambda a^2 \right]
+
+    :param aH: Outer horizon scale :math:`a_H`. Default is ``1.2``.
+    :type aH: float
+
+    :param ah: Inner horizon scale :math:`a_h`. Default is ``1``.
+    :type ah: float
+
+    :param amplitude: Overall factor :math:`A`. Default is ``1.5``.
+    :type amplitude: float
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        from manim import *
+        from manim_string_cosmo import *
+
+        family = Induced_Potential_Family()
+        a = np.linspace(1.2, 6, 200)
+        # One row per (J, Lambda) variant, sharing the common terms.
+        values = family.evaluate(a, [(5, 0), (10, 0), (5, 0.9 / 40)])
+        # A single variant, ready for Plot_General.plot_function.
+        potential = family.variant(junction=7, cc=0.01)
+    """
+
+    def __init__(
+        self,
+        aH: float = 1.2,
+        ah: float = 1,
+        amplitude: float = 1.5,
+    ):
+        self.aH = aH
+        self.ah = ah
+        self.amplitude = amplitude
+
+    def shared_terms(self, a: np.ndarray) -> tuple:
+        r"""
+        Terms of the potential that do not depend on :math:`J` or :math:`\Lambda`.
+
+        :param a: Scale factors.
+        :type a: np.ndarray
+
+        :return: ``(a**2, a**6, horizon term, flux offset, flux slope)``.
+        :rtype: tuple
+        """
+        a = np.asarray(a, dtype=float)
+        a2 = a**2
+        a4 = a2**2
+        a6 = a4 * a2
+        aH2, ah2 = self.aH**2, self.ah**2
+        horizon = (aH2 - a2) * (ah2 - a2) * (aH2 + ah2 + 1 + a2) / a4
+        flux_offset = a4 - aH2**2
+        flux_slope = np.sqrt(aH2 + ah2 + 1) / self.aH * (1 - aH2 / a2)
+        return a2, a6, horizon, flux_offset, flux_slope
+
+    def __call__(self, a: np.ndarray, junction: float = 5, cc: float = 0) -> np.ndarray:
+        r"""
+        Evaluate one member of the family.
+
+        :param a: Scale factors.
+        :type a: np.ndarray
+
+        :param junction: Junction parameter :math:`J`. Default is ``5``.
+        :type junction: float
+
+        :param cc: Cosmological constant coefficient :math:`\Lambda`. Default is ``0``.
+        :type cc: float
+
+        :return: Values of the potential.
+        :rtype: np.ndarray
+        """
+        a2, a6, horizon, flux_offset, flux_slope = self.shared_terms(a)
+        flux = (flux_offset + junction * flux_slope) ** 2 / (junction**2 + a6)
+        return self.amplitude * (horizon - flux - cc * a2)
+
+    def evaluate(self, a: np.ndarray, variants: list) -> np.ndarray:
+        """
+        Evaluate several members of the family on the same scale factors.
+
+        :param a: Scale factors.
+        :type a: np.ndarray
+
+        :param variants: ``(junction, cc)`` pairs.
+        :type variants: list
+
+        :return: Array with one row per variant.
+        :rtype: np.ndarray
+        """
+        a2, a6, horizon, flux_offset, flux_slope = self.shared_terms(a)
+        junction, cc = (np.asarray(p, dtype=float)[:, None] for p in zip(*variants))
+        flux = (flux_offset + junction * flux_slope) ** 2 / (junction**2 + a6)
+        return self.amplitude * (horizon - flux - cc * a2)
+
+    def variant(self, junction: float = 5, cc: float = 0) -> Callable:
+        r"""
+        Return one member of the family as a vectorized function of :math:`a`.
+
+        :param junction: Junction parameter :math:`J`. Default is ``5``.
+        :type junction: float
+
+        :param cc: Cosmological constant coefficient :math:`\Lambda`. Default is ``0``.
+        :type cc: float
+
+        :return: Function of the scale factors.
+        :rtype: Callable
+        """
+        return lambda a: self(a, junction=junction, cc=cc)
@@ -1,8 +1,26 @@
+from typing import Callable
+
 from ..my_imports import *
 
 __all__ = ["Plot_General"]
 
 
+def _vectorized(function: Callable) -> Callable:
+    # Evaluate ``function`` on a whole array of x values at once. Functions written
+    # for scalars only (e.g. with ``math``, or with an ``if`` on x) are evaluated
+    # point by point instead.
+    # Functions returning one row per curve are left as they are.
+    def evaluate(x: np.ndarray) -> np.ndarray:
+        try:
+            y = function(x)
+        except (TypeError, ValueError):
+            y = np.vectorize(function, otypes=[float])(x)
+        y = np.asarray(y, dtype=float)
+        return y if y.ndim == 2 else np.broadcast_to(y, np.shape(x))
+
+    return evaluate
+
+
 class Plot_General(Group):
     """
     Base class for all plot objects providing common styling and configuration parameters.
@@ -59,6 +77,14 @@ class Plot_General(Group):
     :param tightness: Buffer distance between plot content and decorator frame.
     :type tightness: float, default=0.3
 
+    :param adaptive_sampling: Whether curves are sampled adaptively (more points where
+        they bend, fewer where they are flat) instead of on a uniform grid.
+        See :meth:`adaptive_samples`.
+    :type adaptive_sampling: bool, default=True
+
+    :param max_points: Maximum number of sample points of an adaptively sampled curve.
+    :type max_points: int, default=400
+
     :param kwargs: Additional keyword arguments passed to :class:`Group`.
 
     .. note::
@@ -109,6 +135,8 @@ class Plot_General(Group):
         stroke_w: float = 1,
         stroke_opa: float = 1,
         tightness: float = 0.3,
+        adaptive_sampling: bool = True,
+        max_points: int = 400,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -126,3 +154,191 @@ class Plot_General(Group):
         self.stroke_w = stroke_w
         self.stroke_opa = stroke_opa
         self.tightness = tightness
+        self.adaptive_sampling = adaptive_sampling
+        self.max_points = max_points
+
+    def adaptive_samples(
+        self,
+        axes: CoordinateSystem,
+        function: Callable,
+        x_range: list,
+        tolerance: float = 0.01,
+        max_points: int = None,
+        initial_points: int = 33,
+    ) -> tuple:
+        """
+        Sample a function more densely where its graph bends.
+
+        The graph starts as a coarse uniform polyline. Every segment is then checked at
+        its midpoint: if the curve deviates from the segment by more than ``tolerance``
+        (in scene units), the segment is split in two. Splitting stops when every
+        segment is within tolerance or the point budget is used up; when the budget is
+        short, the worst segments are split first. Each round evaluates the function
+        once, on all new midpoints together.
+
+        A function returning one row of values per curve samples several curves on a
+        common grid, refined wherever one of them bends.
+
+        :param axes: Axes where the function is plotted.
+        :type axes: CoordinateSystem
+
+        :param function: Vectorized function of ``x``, returning an array of the same
+            length, or an array with one such row per curve.
+        :type function: Callable
+
+        :param x_range: ``[x_min, x_max]``. A step, if given, is ignored.
+        :type x_range: list
+
+        :param tolerance: Largest allowed distance between the curve and its polyline,
+            in scene units. Default is ``0.01``.
+        :type tolerance: float
+
+        :param max_points: Maximum number of samples. Default is :attr:`max_points`.
+        :type max_points: int
+
+        :param initial_points: Number of samples of the starting uniform grid.
+            Default is ``33``.
+        :type initial_points: int
+
+        :return: The sampled ``x`` values and the corresponding points of the graph
+            (for several curves, with one column of points per curve).
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        function = _vectorized(function)
+        rows = np.ndim(function(np.array([x_range[0]]))) == 2
+        max_points = self.max_points if max_points is None else max_points
+        x_min, x_max = x_range[0], x_range[1]
+        min_width = (x_max - x_min) * 1e-6
+
+        def graph_points(x):
+            values = np.atleast_2d(function(x))
+            points = [np.asarray(axes.coords_to_point(x, y)).T for y in values]
+            return np.stack(points, axis=1)
+
+        def deviation(mid_points, points):
+            chords = (points[:-1] + points[1:]) / 2
+            distance = np.linalg.norm(mid_points - chords, axis=2)
+            return np.nan_to_num(distance, nan=0, posinf=0).max(axis=1)
+
+        xs = np.linspace(x_min, x_max, max(2, min(initial_points, max_points)))
+        points = graph_points(xs)
+        mid_xs = (xs[:-1] + xs[1:]) / 2
+        mid_points = graph_points(mid_xs)
+        errors = deviation(mid_points, points)
+
+        while len(xs) < max_points:
+            candidates = np.nonzero((errors > tolerance) & (np.diff(xs) > min_width))[0]
+            if len(candidates) == 0:
+                break
+            budget = max_points - len(xs)
+            if len(candidates) > budget:
+                candidates = np.sort(candidates[np.argsort(errors[candidates])[-budget:]])
+
+            split = np.zeros(len(errors), dtype=bool)
+            split[candidates] = True
+            owner = np.repeat(np.arange(len(errors)), 1 + split)
+            new = split[owner]
+
+            xs = np.insert(xs, candidates + 1, mid_xs[candidates])
+            points = np.insert(points, candidates + 1, mid_points[candidates], axis=0)
+            mid_xs = (xs[:-1] + xs[1:]) / 2
+            kept_mid_points = mid_points[owner]
+            kept_mid_points[new] = graph_points(mid_xs[new])
+            mid_points = kept_mid_points
+            errors = deviation(mid_points, points)
+
+        return xs, points if rows else points[:, 0]
+
+    def plot_function(
+        self,
+        axes: CoordinateSystem,
+        function: Callable,
+        x_range: list = None,
+        adaptive: bool = None,
+        tolerance: float = 0.01,
+        max_points: int = None,
+        **kwargs,
+    ) -> ParametricFunction:
+        """
+        Plot a function on some axes, evaluating it on the whole x grid at once.
+
+        The function receives the array of all sample points and must return an array
+        of the same length, so any NumPy expression (or any callable object working on
+        arrays) can be used. Points are then mapped to the axes and turned into bezier
+        curves in bulk, instead of one Python call per sample.
+
+        With adaptive sampling, the samples come from :meth:`adaptive_samples` instead
+        of a uniform grid: flat stretches get few points and sharp features get many,
+        which also makes ``Create``/``Write`` of the curve cheaper.
+
+        :param axes: Axes where the function is plotted.
+        :type axes: CoordinateSystem
+
+        :param function: Vectorized function of ``x``. Functions that only accept
+            scalars still work, but are evaluated point by point.
+        :type function: Callable
+
+        :param x_range: ``[x_min, x_max]`` or ``[x_min, x_max, x_step]``, as in
+            :meth:`Axes.plot`. Default is the range of the axes. The step is only used
+            by uniform sampling.
+        :type x_range: list
+
+        :param adaptive: Whether to sample adaptively. Default is :attr:`adaptive_sampling`.
+            Curves with ``discontinuities`` are always sampled uniformly.
+        :type adaptive: bool
+
+        :param tolerance: Tolerance of the adaptive sampling, in scene units.
+            Default is ``0.01``.
+        :type tolerance: float
+
+        :param max_points: Point budget of the adaptive sampling.
+            Default is :attr:`max_points`.
+        :type max_points: int
+
+        :param kwargs: Additional keyword arguments passed to :meth:`Axes.plot`
+            (e.g. ``color``, ``stroke_width``, ``use_smoothing``).
+
+        :return: The graph of the function.
+        :rtype: ParametricFunction
+
+        **Example usage:**
+
+        .. code-block:: python
+
+            plot = Plot_General()
+            ax = NumberPlane(x_range=[0, 4, 1], y_range=[-1, 1, 1])
+            graph = plot.plot_function(ax, lambda x: np.sin(x**2), x_range=[0, 4])
+        """
+        adaptive = self.adaptive_sampling if adaptive is None else adaptive
+        if not adaptive or kwargs.get("discontinuities") is not None:
+            return axes.plot(
+                _vectorized(function), x_range=x_range, use_vectorized=True, **kwargs
+            )
+
+        if x_range is None:
+            x_range = axes.x_range
+        _, points = self.adaptive_samples(
+            axes, function, x_range, tolerance=tolerance, max_points=max_points
+        )
+        return self._graph_through(axes, function, x_range, points, **kwargs)
+
+    def _graph_through(
+        self,
+        axes: CoordinateSystem,
+        function: Callable,
+        x_range: list,
+        points: np.ndarray,
+        **kwargs,
+    ) -> ParametricFunction:
+        # Let manim set up the graph (style, underlying function) from its two end
+        # points only, then put in the sampled points.
+        graph = axes.plot(
+            _vectorized(function),
+            x_range=[x_range[0], x_range[1], x_range[1] - x_range[0]],
+            use_vectorized=True,
+            **kwargs,
+        )
+        graph.set_points_as_corners(points)
+        if graph.use_smoothing:
+            graph.make_smooth()
+        return graph
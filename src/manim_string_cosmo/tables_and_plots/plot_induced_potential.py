@@ -1,5 +1,7 @@
 from ..my_imports import *
+from ..utils.tracker_bindings import *
 
+from .induced_potential_family import *
 from .plot_general import *
 
 __all__ = ["Plot_Induced_Potential"]
@@ -72,72 +74,22 @@ class Plot_Induced_Potential(Plot_General, Group):
         )
 
         # Potential and labels
-        self.pot_4D_cosmos_og = self.ax_4D_cosmos.plot(
-            lambda x: 1.5
-            * (
-                (1 / x**4) * (1.2**2 - x**2) * (1 - x**2) * (1.2**2 + 1 + 1 + x**2)
-                - (1 / (5**2 + x**6))
-                * (
-                    x**4
-                    - 1.2**4
-                    + (5 / 1.2) * ((1 + 1.2**2 + 1) ** (1 / 2)) * (1 - 1.2**2 / x**2)
-                )
-                ** 2
-                - (0 / 40) * x**2
-            ),
-            color=self.func_main_color,
-            stroke_width=self.decorator_stroke_w,
-            use_smoothing=True,
-            x_range=[1.2, 6],
-        )
-
-        self.pot_4D_cosmos_jc_change = DashedVMobject(
-            self.ax_4D_cosmos.plot(
-                lambda x: 1.5
-                * (
-                    (1 / x**4) * (1.2**2 - x**2) * (1 - x**2) * (1.2**2 + 1 + 1 + x**2)
-                    - (1 / (10**2 + x**6))
-                    * (
-                        x**4
-                        - 1.2**4
-                        + (10 / 1.2)
-                        * ((1 + 1.2**2 + 1) ** (1 / 2))
-                        * (1 - 1.2**2 / x**2)
-                    )
-                    ** 2
-                    - (0 / 40) * x**2
-                ),
-                color=self.func_2_color,
-                stroke_width=self.decorator_stroke_w,
-                use_smoothing=True,
-                x_range=[1.2, 6],
-            )
-        )
-
-        self.pot_4D_cosmos_with_cc = self.ax_4D_cosmos.plot(
-            lambda x: 1.5
-            * (
-                (1 / x**4) * (1.2**2 - x**2) * (1 - x**2) * (1.2**2 + 1 + 1 + x**2)
-                - (1 / (5**2 + x**6))
-                * (
-                    x**4
-                    - 1.2**4
-                    + (5 / 1.2) * ((1 + 1.2**2 + 1) ** (1 / 2)) * (1 - 1.2**2 / x**2)
-                )
-                ** 2
-                - (0.9 / 40) * x**2
-            ),
-            color=self.func_3_color,
-            stroke_width=self.decorator_stroke_w,
-            use_smoothing=True,
-            x_range=[1.2, 6],
+        self.family = Induced_Potential_Family(aH=aH, ah=ah)
+        self.variants = []
+
+        (
+            self.pot_4D_cosmos_og,
+            self.pot_4D_cosmos_jc_change,
+            self.pot_4D_cosmos_with_cc,
+        ) = self.plot_variants(
+            [(5, 0), (10, 0), (5, 0.9 / 40)],
+            colors=[None, self.func_2_color, self.func_3_color],
+            dashed=[False, True, False],
         )
 
         self.position = Dot(color=self.decorator_color, stroke_width=self.stroke_w)
-        self.pos_track = ValueTracker(1.2)
-        self.position.add_updater(
-            lambda y: y.move_to(self.ax_4D_cosmos.c2p(self.pos_track.get_value(), 0))
-        )
+        self.pos_track = Watched_Tracker(1.2)
+        bind_to_tracker(self.position, self.pos_track, self.ax_4D_cosmos)
 
         if self.decorator_presence == "box":
             box = SurroundingRectangle(
@@ -168,6 +120,129 @@ class Plot_Induced_Potential(Plot_General, Group):
                 self.position,
             )
 
+    def plot_variant(
+        self,
+        junction: float = 5,
+        cc: float = 0,
+        color: ParsableManimColor = None,
+        dashed: bool = False,
+    ) -> VMobject:
+        r"""
+        Plot a member of the potential family on the axes, without adding it.
+
+        :param junction: Junction parameter :math:`J` of the potential.
+        :type junction: float
+
+        :param cc: Cosmological constant coefficient :math:`\Lambda` of the potential.
+        :type cc: float
+
+        :param color: Color of the curve. Default is the main function color.
+        :type color: ParsableManimColor
+
+        :param dashed: Whether the curve is dashed.
+        :type dashed: bool
+
+        :return: The curve of the potential.
+        :rtype: VMobject
+
+        """
+        return self.plot_variants([(junction, cc)], colors=[color], dashed=[dashed])[0]
+
+    def plot_variants(
+        self, variants: list, colors: list = None, dashed: list = None
+    ) -> list:
+        r"""
+        Plot several members of the potential family on the axes, on a common grid.
+
+        All the variants are sampled on the same scale factors (refined wherever one of
+        them bends), so :meth:`Induced_Potential_Family.evaluate` computes the terms
+        they share once per sampling round for all of them. None of the curves is
+        added to the group.
+
+        :param variants: ``(junction, cc)`` pairs, i.e. :math:`(J, \Lambda)`.
+        :type variants: list
+
+        :param colors: Color of each curve, ``None`` for the main function color.
+            Default is the main function color for all.
+        :type colors: list
+
+        :param dashed: Whether each curve is dashed. Default is ``False`` for all.
+        :type dashed: list
+
+        :return: The curves of the potentials, in the order of ``variants``.
+        :rtype: list
+        """
+        variants = [tuple(variant) for variant in variants]
+        colors = [None] * len(variants) if colors is None else colors
+        dashed = [False] * len(variants) if dashed is None else dashed
+        x_range = [1.2, 6]
+
+        def evaluate(a):
+            return self.family.evaluate(a, variants)
+
+        if self.adaptive_sampling:
+            _, points = self.adaptive_samples(self.ax_4D_cosmos, evaluate, x_range)
+        else:
+            a = np.linspace(*x_range, self.max_points)
+            rows = [self.ax_4D_cosmos.coords_to_point(a, v) for v in evaluate(a)]
+            points = np.stack([np.asarray(row).T for row in rows], axis=1)
+
+        curves = []
+        for i, (junction, cc) in enumerate(variants):
+            curve = self._graph_through(
+                self.ax_4D_cosmos,
+                self.family.variant(junction=junction, cc=cc),
+                x_range,
+                points[:, i],
+                color=self.func_main_color if colors[i] is None else colors[i],
+                stroke_width=self.decorator_stroke_w,
+                use_smoothing=True,
+            )
+            curves.append(DashedVMobject(curve) if dashed[i] else curve)
+        return curves
+
+    def add_variant(
+        self,
+        junction: float = 5,
+        cc: float = 0,
+        color: ParsableManimColor = None,
+        dashed: bool = False,
+    ) -> VMobject:
+        r"""
+        Plot a further member of the potential family and add it to the group.
+
+        The curve is also appended to ``self.variants``. To plot several variants at
+        once, with their shared terms evaluated once, see :meth:`plot_variants`.
+
+        :param junction: Junction parameter :math:`J` of the potential.
+        :type junction: float
+
+        :param cc: Cosmological constant coefficient :math:`\Lambda` of the potential.
+        :type cc: float
+
+        :param color: Color of the curve. Default is the main function color.
+        :type color: ParsableManimColor
+
+        :param dashed: Whether the curve is dashed.
+        :type dashed: bool
+
+        :return: The curve of the potential, e.g. to ``Write`` it.
+        :rtype: VMobject
+
+        **Example usage:**
+
+        .. code-block:: python
+
+            plot_pot = Plot_Induced_Potential()
+            for j in [6, 7, 8]:
+                self.play(Write(plot_pot.add_variant(junction=j, color=YELLOW)))
+
+        """
+        curve = self.plot_variant(junction=junction, cc=cc, color=color, dashed=dashed)
+        self.variants.append(curve)
+        self.add(curve)
+        return curve
+
     def show_potential(self, rt: float = 2, rf: float = linear) -> Animation:
         """
         Writes the original potential.
@@ -1,4 +1,5 @@
 from ..my_imports import *
+from ..utils.tracker_bindings import *
 from .plot_general import *
 
 __all__ = ["Plot_Instanton"]
@@ -76,7 +77,8 @@ class Plot_Instanton(Plot_General, Group):
         )
 
         # Potential and labels
-        pot_ins = self.ax_ins.plot(
+        pot_ins = self.plot_function(
+            self.ax_ins,
             lambda x: (-2 * x**2 + (x - 0.1) ** 4 + 0.64),
             color=self.func_main_color,
             stroke_width=self.axis_stroke,
@@ -104,10 +106,8 @@ class Plot_Instanton(Plot_General, Group):
         self.field_position = Dot(
             color=self.decorator_color, stroke_width=self.stroke_w, fill_opacity=1
         )
-        self.tracker_ins = ValueTracker(-0.845649)
-        self.field_position.add_updater(
-            lambda y: y.move_to(self.ax_ins.c2p(self.tracker_ins.get_value(), 0))
-        )
+        self.tracker_ins = Watched_Tracker(-0.845649)
+        bind_to_tracker(self.field_position, self.tracker_ins, self.ax_ins)
 
         if self.decorator_presence == "box":
             box = SurroundingRectangle(
@@ -58,7 +58,8 @@ class Plot_Quantum(Plot_General, VGroup):
         regions[1].next_to(split_regions, RIGHT, buff=1)
 
         # Potential
-        pot_q_cosmo = self.ax_q_cosmo.plot(
+        pot_q_cosmo = self.plot_function(
+            self.ax_q_cosmo,
             lambda x: x**2 - x**4 / (4) ** 2,
             color=self.func_main_color,
             x_range=[0, 4.07],
@@ -71,7 +72,8 @@ class Plot_Quantum(Plot_General, VGroup):
         )
 
         # Wave functions and labels
-        self.HHawking = self.ax_q_cosmo.plot(
+        self.HHawking = self.plot_function(
+            self.ax_q_cosmo,
             lambda x: 1
             / 3
             * (
@@ -87,7 +89,8 @@ class Plot_Quantum(Plot_General, VGroup):
             use_smoothing=True,
         ).set_color(self.func_3_color)
 
-        self.Vilenkin = self.ax_q_cosmo.plot(
+        self.Vilenkin = self.plot_function(
+            self.ax_q_cosmo,
             lambda x: 1
             / 3
             * (
@@ -51,7 +51,8 @@ class Plot_Lambda_Tension(Plot_General, VGroup):
         km = 4
 
         # Potential and labels
-        self.pot_tension_DB = self.ax_tension_DB.plot(
+        self.pot_tension_DB = self.plot_function(
+            self.ax_tension_DB,
             lambda x: (x**2) / 12
             - 3 / 2 * (kp**2 + km**2)
             + 27 / 4 * ((km**2 - kp**2) / x) ** 2,
@@ -62,7 +63,8 @@ class Plot_Lambda_Tension(Plot_General, VGroup):
         )
 
         self.pot_tension_DB_2 = DashedVMobject(
-            self.ax_tension_DB.plot(
+            self.plot_function(
+                self.ax_tension_DB,
                 lambda x: (x**2) / 12
                 - 3 / 2 * (kp**2 + km**2)
                 + 27 / 4 * ((km**2 - kp**2) / x) ** 2,
@@ -73,7 +75,8 @@ class Plot_Lambda_Tension(Plot_General, VGroup):
             )
         )
 
-        self.pot_tension_DB_3 = self.ax_tension_DB.plot(
+        self.pot_tension_DB_3 = self.plot_function(
+            self.ax_tension_DB,
             lambda x: (x**2) / 12
             - 3 / 2 * (kp**2 + km**2)
             + 27 / 4 * ((km**2 - kp**2) / x) ** 2,
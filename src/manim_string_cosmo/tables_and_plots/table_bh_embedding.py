@@ -61,40 +61,27 @@ class Table_Bh_Embedding(Table_General, Group):
             "\\phi_{2}",
             "\\phi_{3}",
         ]
+        coordinates_mob = [MathTex(coord, font_size=60) for coord in coordinates]
 
-        coordinates_non_compact = coordinates[0:4]
-        coordinates_compact = coordinates[4:]
-
-        coordinates_mob_non_compact = VGroup(
-            *[
-                MathTex(coordinates_non_compact[i], font_size=60)
-                for i in range(len(coordinates_non_compact))
-            ]
-        )
-        coordinates_mob_compact = VGroup(
-            *[
-                MathTex(coordinates_compact[i], font_size=60)
-                for i in range(len(coordinates_compact))
-            ]
-        )
+        # Highlight of each coordinate: 4D, AdS throat, compact space.
+        colors = 3 * [self.hlight_1_color] + [self.hlight_2_color]
+        colors += 5 * [self.hlight_3_color]
 
         # Dimension representation
-        opa_table = self.fill_opa + 0.1  # For it to be a little bit more intense.
+        self.opa_table = self.fill_opa + 0.1  # For it to be a little bit more intense.
 
         # 4D
-        three_dim = VGroup(
-            *[
-                RoundedRectangle(
-                    corner_radius=self.corner_rad,
-                    height=1.4,
-                    width=1.4,
-                    color=self.hlight_1_color,
-                    fill_opacity=2 * opa_table,
-                    stroke_width=self.stroke_w,
-                )
-                for _ in range(3)
-            ]
-        )
+        three_dim = [
+            RoundedRectangle(
+                corner_radius=self.corner_rad,
+                height=1.4,
+                width=1.4,
+                color=self.hlight_1_color,
+                fill_opacity=2 * self.opa_table,
+                stroke_width=self.stroke_w,
+            )
+            for _ in range(3)
+        ]
 
         # Ads Throat
         self.ads_dim = Line(color=self.hlight_2_color, stroke_width=0.7).rotate(PI / 4)
@@ -102,188 +89,78 @@ class Table_Bh_Embedding(Table_General, Group):
             Dot(color=self.hlight_2_color).scale(1.5).move_to(self.ads_dim.get_start())
         )
 
-        non_compact_dim = (
-            VGroup()
-            .add(*[ts for ts in three_dim])
-            .add(VGroup(self.ads_dim, self.position_ads_dim))
-        )
-
-        # Compact space
-        cicle = Circle(
-            radius=0.7, stroke_width=self.stroke_w, color=self.hlight_3_color
-        ).rotate(-PI / 2)
-        position_cicle = (
-            Dot(color=self.hlight_3_color).scale(1.5).move_to(cicle.get_end())
-        )
-
-        comp = VGroup(cicle, position_cicle)
-        self.compact_dim = VGroup(
-            *[comp.copy() for _ in range(len(coordinates_mob_compact))]
-        )
-
-        for i in range(1, 4):
-            self.compact_dim[-i][-1].move_to(cicle[-1][0].get_start())
-
-        tab_non_compact = MobjectTable(
-            [coordinates_mob_non_compact, non_compact_dim],
-            line_config={"stroke_width": self.stroke_w, "color": self.decorator_color},
-            include_outer_lines=False,
-        )
-        box_non_compact = RoundedRectangle(
-            corner_radius=self.corner_rad,
-            height=tab_non_compact.get_height(),
-            width=tab_non_compact.get_width(),
-            stroke_width=self.decorator_stroke_w,
-            color=self.decorator_color,
-            fill_opacity=0,
-        ).set_z_index(-3)
-
-        for i in range(4):
-            if i == 0:
-                tab_non_compact.add_highlighted_cell(
-                    (1, i + 1),
-                    color=self.hlight_1_color,
-                    fill_opacity=opa_table,
-                    corner_radius=list(self.corner_rad[0] * np.array([1, 0, 0, 0])),
-                )  # to bend only left corner
-                coordinates_mob_non_compact[i].set(
-                    color=self.hlight_1_color, fill_opacity=opa_table
-                )
-            elif i == 3:
-                tab_non_compact.add_highlighted_cell(
-                    (1, i + 1),
-                    color=self.hlight_2_color,
-                    fill_opacity=opa_table,
-                    corner_radius=list(self.corner_rad[0] * np.array([0, 0, 0, 1])),
-                )
-                coordinates_mob_non_compact[i].set(
-                    color=self.hlight_2_color, fill_opacity=opa_table
-                )
-            else:
-                tab_non_compact.add_highlighted_cell(
-                    (1, i + 1), color=self.hlight_1_color, fill_opacity=opa_table
-                )
-                coordinates_mob_non_compact[i].set(
-                    color=self.hlight_1_color, fill_opacity=opa_table
-                )
-
-        tab_compact = MobjectTable(
-            [coordinates_mob_compact, self.compact_dim],
-            line_config={"stroke_width": self.stroke_w, "color": self.decorator_color},
-            include_outer_lines=False,
-        )
-        box_compact = RoundedRectangle(
-            corner_radius=self.corner_rad,
-            height=tab_compact.get_height(),
-            width=tab_compact.get_width(),
-            stroke_width=self.decorator_stroke_w,
-            color=self.decorator_color,
-            fill_opacity=0,
-        ).set_z_index(-3)
+        ads_throat = VGroup(self.ads_dim, self.position_ads_dim)
+        non_compact_dim = VGroup(*three_dim, ads_throat)
+
+        # Compact space, each circle with the brane position at its start.
+        self.compact_dim = VGroup()
+        for _ in coordinates[4:]:
+            cicle = Circle(
+                radius=0.7, stroke_width=self.stroke_w, color=self.hlight_3_color
+            ).rotate(-PI / 2)
+            position_cicle = (
+                Dot(color=self.hlight_3_color).scale(1.5).move_to(cicle.get_start())
+            )
+            self.compact_dim.add(VGroup(cicle, position_cicle))
+
+        # The same mobjects in a single row, as in the "together" layout.
+        self.all_coordinates = VGroup(*coordinates_mob)
+        self.all_dimensions = VGroup(*non_compact_dim, *self.compact_dim)
+
+        # Only the tables of the requested layout are built.
+        if type == "together":
+            self.add(
+                *self._highlighted_table(coordinates_mob, self.all_dimensions, colors)
+            )
 
-        for i in range(len(coordinates_mob_compact)):
-            if i == 0:
-                tab_compact.add_highlighted_cell(
-                    (1, i + 1),
-                    color=self.hlight_3_color,
-                    fill_opacity=opa_table,
-                    corner_radius=list(self.corner_rad[0] * np.array([1, 0, 0, 0])),
-                )
-                coordinates_mob_compact[i].set(
-                    color=self.hlight_3_color, fill_opacity=opa_table
-                )
-            elif i == 4:
-                tab_compact.add_highlighted_cell(
-                    (1, i + 1),
-                    color=self.hlight_3_color,
-                    fill_opacity=opa_table,
-                    corner_radius=list(self.corner_rad[0] * np.array([0, 0, 0, 1])),
-                )
-                coordinates_mob_compact[i].set(
-                    color=self.hlight_3_color, fill_opacity=opa_table
-                )
-            else:
-                tab_compact.add_highlighted_cell(
-                    (1, i + 1), color=self.hlight_3_color, fill_opacity=opa_table
+        elif type == "split":
+            noncomp = VGroup(
+                *self._highlighted_table(
+                    coordinates_mob[:4], non_compact_dim, colors[:4]
                 )
-                coordinates_mob_compact[i].set(
-                    color=self.hlight_3_color, fill_opacity=opa_table
+            )
+            comp = VGroup(
+                *self._highlighted_table(
+                    coordinates_mob[4:], self.compact_dim, colors[4:]
                 )
+            )
+            noncomp.next_to(comp, chosen_position)
+            self.add(comp, noncomp)
 
-        # ALL DIMENSIONS TOGETHER
-
-        self.all_dimensions = non_compact_dim.copy().add(
-            *[element.copy() for element in self.compact_dim.copy()]
-        )
-        self.all_coordinates = coordinates_mob_non_compact.copy().add(
-            *[element.copy() for element in coordinates_mob_compact.copy()]
-        )
-
-        tab_all = MobjectTable(
-            [self.all_coordinates, self.all_dimensions],
+    def _highlighted_table(
+        self, coordinates: list, dimensions: VGroup, colors: list
+    ) -> tuple:
+        # Table of the coordinates over their dimensions, every column highlighted
+        # with its color, and the box around it.
+        table = MobjectTable(
+            [VGroup(*coordinates), dimensions],
             line_config={"stroke_width": self.stroke_w, "color": self.decorator_color},
             include_outer_lines=False,
         )
-        box_all = RoundedRectangle(
+        box = RoundedRectangle(
             corner_radius=self.corner_rad,
-            height=tab_all.get_height(),
-            width=tab_all.get_width(),
+            height=table.get_height(),
+            width=table.get_width(),
             stroke_width=self.decorator_stroke_w,
             color=self.decorator_color,
             fill_opacity=0,
         ).set_z_index(-3)
 
-        for i in range(9):
-            if i == 0:
-                tab_all.add_highlighted_cell(
-                    (1, i + 1),
-                    color=self.hlight_1_color,
-                    fill_opacity=opa_table,
-                    corner_radius=list(self.corner_rad[0] * np.array([1, 0, 0, 0])),
-                )
-                self.all_coordinates[i].set(
-                    color=self.hlight_1_color, fill_opacity=opa_table
-                )
-            elif i == 8:
-                tab_all.add_highlighted_cell(
-                    (1, i + 1),
-                    color=self.hlight_3_color,
-                    fill_opacity=opa_table,
-                    corner_radius=list(self.corner_rad[0] * np.array([0, 0, 0, 1])),
-                )
-                self.all_coordinates[i].set(
-                    color=self.hlight_3_color, fill_opacity=opa_table
-                )
-            elif 0 < i < 3:
-                tab_all.add_highlighted_cell(
-                    (1, i + 1), color=self.hlight_1_color, fill_opacity=opa_table
-                )
-                self.all_coordinates[i].set(
-                    color=self.hlight_1_color, fill_opacity=opa_table
-                )
-            elif i == 3:
-                tab_all.add_highlighted_cell(
-                    (1, i + 1), color=self.hlight_2_color, fill_opacity=opa_table
-                )
-                self.all_coordinates[i].set(
-                    color=self.hlight_2_color, fill_opacity=opa_table
-                )
-            else:
-                tab_all.add_highlighted_cell(
-                    (1, i + 1), color=self.hlight_3_color, fill_opacity=opa_table
-                )
-                self.all_coordinates[i].set(
-                    color=self.hlight_3_color, fill_opacity=opa_table
-                )
-
-        if type == "together":
-            self.add(tab_all, box_all)
-
-        elif type == "split":
-            noncomp = VGroup(tab_non_compact, box_non_compact)
-            comp = VGroup(tab_compact, box_compact)
-            noncomp.next_to(comp, chosen_position)
-            self.add(comp, noncomp)
+        for i, (coordinate, color) in enumerate(zip(coordinates, colors)):
+            corners = {}
+            if i == 0:  # to bend only left corner
+                corners["corner_radius"] = list(
+                    self.corner_rad[0] * np.array([1, 0, 0, 0])
+                )
+            elif i == len(coordinates) - 1:
+                corners["corner_radius"] = list(
+                    self.corner_rad[0] * np.array([0, 0, 0, 1])
+                )
+            table.add_highlighted_cell(
+                (1, i + 1), color=color, fill_opacity=self.opa_table, **corners
+            )
+            coordinate.set(color=color, fill_opacity=self.opa_table)
+        return table, box
 
     def move_non_compact(
         self, rt: float = 3, rf: float = rate_functions.linear
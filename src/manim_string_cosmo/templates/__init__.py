@@ -1,4 +1,6 @@
 from .color_scheme import *
+from .template import *
 
 __all__ = []
 __all__ += color_scheme.__all__
+__all__ += template.__all__
@@ -1 +0,0 @@
-# Template collection for string cosmology visualizations
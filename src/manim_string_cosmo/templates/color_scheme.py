@@ -1,11 +1,9 @@
-import importlib
-
-from ..my_imports import *
+from .template import *
 
 __all__ = ["import_template_string_cosmo"]
 
 
-def import_template_string_cosmo(module_name: str):
+def import_template_string_cosmo(module_name: str) -> Cosmo_Template:
     """
     Import a chosen template to standardize styling for string cosmology visualizations.
 
@@ -16,7 +14,9 @@ def import_template_string_cosmo(module_name: str):
     :param module_name: Name of the template to import. Must be one of the allowed templates.
     :type module_name: str
 
-    :raises ModuleNotFoundError: If the specified template module cannot be found.
+    :return: The applied template. Call its ``restore()`` method to go back to the
+        previous styling, or use :func:`get_template` as a context manager instead.
+    :rtype: Cosmo_Template
 
     .. note::
 
@@ -47,23 +47,10 @@ def import_template_string_cosmo(module_name: str):
                 # Your string_cosmo objects will now use the selected template
                 pass
     """
-    allowed_modules = [
-        "cosmic_dawn",
-        "quantum_dusk",
-        "dark_energy",
-        "green_mint",
-        "blue_ice",
-        "red_autumn",
-        "beamer_blue",
-        "beamer_green"
-    ]
-
-    # Import base template
-    if module_name in allowed_modules:
-        module_path = f"manim_string_cosmo.templates.collection.{module_name}"
+    if module_name in available_templates():
         print(f"Using '{module_name}' template for string cosmology!")
     else:
         print(f"Template '{module_name}' does not exist. Using default template instead!")
-        module_path = "manim_string_cosmo.templates.collection.default_template"
+        module_name = "default_template"
 
-    importlib.import_module(module_path)
+    return get_template(module_name).apply()
@@ -0,0 +1,372 @@
+import importlib
+import json
+import os
+from pathlib import Path
+
+__all__ = [
+    "Cosmo_Template",
+    "register_template",
+    "load_templates",
+    "get_template",
+    "available_templates",
+    "current_template",
+]
+
+
+_PACKAGE = __name__.split(".")[0]
+
+# The templates of the package, one entry per template.
+_TEMPLATES_FILE = Path(__file__).with_name("templates.json")
+
+# Keys every template must define.
+STYLE_KEYS = (
+    "bg_color",
+    "brane_color",
+    "brane_text_color",
+    "brane_fill_opa",
+    "brane_stroke_w",
+    "vacuum_color",
+    "vacuum_fill_opa",
+    "vacuum_stroke_w",
+    "vacuum_text_color",
+    "corner_rad",
+    "corner_rad_direction",
+    "arrow_color",
+    "bh_color",
+    "bh_fill_opa",
+    "string_color",
+    "field_top_color",
+    "tex_temp",
+)
+
+# Keys a template may define, with the value used otherwise.
+_OPTIONAL_STYLE = {
+    "description": "",
+    "axis_opacity": 0.6,
+    "decorator_presence": "box",
+    "tightness": 0.3,
+    "stroke_opa": 1,
+}
+
+# Default arguments set by a template: (module, class, {argument: style key}).
+# A callable instead of a style key computes the argument from the whole style.
+# Classes (and manim itself) are only imported when a template is applied, so that
+# listing or loading templates stays cheap.
+_TARGETS = (
+    ("manim", "Tex", {"tex_template": "tex_temp"}),
+    ("manim", "MathTex", {"tex_template": "tex_temp"}),
+    (
+        f"{_PACKAGE}.objects.brane_general",
+        "Brane_General",
+        {
+            "brane_color": "brane_color",
+            "brane_fill_opa": "brane_fill_opa",
+            "brane_text_color": "brane_text_color",
+            "brane_stroke_w": "brane_stroke_w",
+        },
+    ),
+    (
+        f"{_PACKAGE}.objects.vacuum_general",
+        "Vacuum_General",
+        {
+            "vacuum_color": "vacuum_color",
+            "vacuum_fill_opa": "vacuum_fill_opa",
+            "vacuum_stroke_w": "vacuum_stroke_w",
+            "vacuum_text_color": "vacuum_text_color",
+            "corner_rad": "corner_rad",
+            "corner_rad_direction": "corner_rad_direction",
+        },
+    ),
+    (f"{_PACKAGE}.objects.ads_jc", "AdS_Jc", {"arrow_color": "arrow_color"}),
+    (
+        f"{_PACKAGE}.objects.black_hole",
+        "Black_Hole",
+        {"bh_color": "bh_color", "bh_fill_opa": "bh_fill_opa"},
+    ),
+    (
+        f"{_PACKAGE}.objects.bubble",
+        "Bubble",
+        {"string_color": "string_color", "field_top_color": "field_top_color"},
+    ),
+    (
+        f"{_PACKAGE}.tables_and_plots.table_general",
+        "Table_General",
+        {
+            "text_color": "brane_color",
+            "hlight_1_color": "brane_color",
+            "hlight_2_color": "vacuum_color",
+            "hlight_3_color": "bh_color",
+            "decorator_color": "arrow_color",
+            "decorator_stroke_w": "brane_stroke_w",
+            "corner_rad": "corner_rad",
+            "corner_rad_direction": "corner_rad_direction",
+            "stroke_w": "brane_stroke_w",
+            "stroke_opa": "stroke_opa",
+            "fill_opa": "brane_fill_opa",
+        },
+    ),
+    (
+        f"{_PACKAGE}.tables_and_plots.plot_general",
+        "Plot_General",
+        {
+            "func_main_color": "brane_color",
+            "func_2_color": "vacuum_color",
+            "func_3_color": "bh_color",
+            "text_color": "brane_text_color",
+            "axis_opacity": "axis_opacity",
+            "axis_stroke": lambda style: 2 * style["brane_stroke_w"],
+            "decorator_presence": "decorator_presence",
+            "decorator_color": "arrow_color",
+            "decorator_stroke_w": "brane_stroke_w",
+            "corner_rad": "corner_rad",
+            "corner_rad_direction": "corner_rad_direction",
+            "fill_opa": "brane_fill_opa",
+            "stroke_w": "brane_stroke_w",
+            "stroke_opa": "stroke_opa",
+            "tightness": "tightness",
+        },
+    ),
+)
+
+# Templates by name. The package templates (and the files listed in the environment
+# variable MANIM_STRING_COSMO_TEMPLATES) are read on first use.
+_registry = {}
+_registry_loaded = False
+
+# Templates currently applied, the last one in effect.
+_applied = []
+
+
+def _class_defaults(style: dict) -> list:
+    from manim import TexFontTemplates
+
+    style = {**_OPTIONAL_STYLE, **style}
+    if isinstance(style["tex_temp"], str):
+        style["tex_temp"] = getattr(TexFontTemplates, style["tex_temp"])
+
+    class_defaults = []
+    for module, class_name, arguments in _TARGETS:
+        cls = getattr(importlib.import_module(module), class_name)
+        kwargs = {
+            argument: key(style) if callable(key) else style[key]
+            for argument, key in arguments.items()
+        }
+        class_defaults.append((cls, kwargs))
+    return class_defaults
+
+
+class Cosmo_Template:
+    """
+    Styling template for string cosmology visualizations, which can be switched on and off.
+
+    A template is plain data: colors, opacities, stroke widths, corner radii and the
+    name of a :class:`TexFontTemplates` font (see ``templates/templates.json``).
+    Applying it sets the background color of the scene and the default arguments of
+    the package classes (and of :class:`Tex`/:class:`MathTex`). It can be undone with
+    :meth:`restore`, so a single process can build scenes under several templates
+    one after the other and keep everything it has already loaded and cached.
+
+    :param name: Name of the template.
+    :type name: str
+
+    :param style: Values of the template, with all the keys of ``STYLE_KEYS``.
+        Optional keys: ``"description"``, ``"axis_opacity"``, ``"decorator_presence"``,
+        ``"tightness"`` and ``"stroke_opa"``.
+    :type style: dict
+
+    :raises ValueError: If the style misses some keys.
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        from manim import *
+        from manim_string_cosmo import *
+
+        class Example_Templates(Scene):
+            def construct(self):
+                bubbles = Group()
+                for name in ["dark_energy", "blue_ice", "red_autumn"]:
+                    with get_template(name):
+                        bubbles.add(Bubble().scale(0.3))
+                self.add(bubbles.arrange(RIGHT))
+    """
+
+    def __init__(self, name: str, style: dict):
+        missing = [key for key in STYLE_KEYS if key not in style]
+        if missing:
+            raise ValueError(f"Template '{name}' misses the keys {missing}.")
+        self.name = name
+        self.style = dict(style)
+        self._saved_states = []
+
+    def apply(self) -> "Cosmo_Template":
+        """
+        Make this template the current one, remembering the previous state.
+
+        :return: The template.
+        :rtype: Cosmo_Template
+        """
+        from manim import config
+
+        class_defaults = _class_defaults(self.style)
+        self._saved_states.append(
+            (
+                config.background_color,
+                [(cls, cls.__dict__.get("__init__")) for cls, _ in class_defaults],
+            )
+        )
+        config.background_color = self.style["bg_color"]
+        for cls, kwargs in class_defaults:
+            cls.set_default(**kwargs)
+        _applied.append(self)
+        return self
+
+    def restore(self):
+        """
+        Undo the last :meth:`apply` of this template.
+
+        :raises RuntimeError: If the template has not been applied.
+        """
+        from manim import config
+
+        if not self._saved_states:
+            raise RuntimeError(f"Template '{self.name}' has not been applied.")
+        background_color, inits = self._saved_states.pop()
+        config.background_color = background_color
+        for cls, init in inits:
+            if init is None:
+                if "__init__" in cls.__dict__:
+                    delattr(cls, "__init__")
+            else:
+                cls.__init__ = init
+        for i in reversed(range(len(_applied))):
+            if _applied[i] is self:
+                del _applied[i]
+                break
+
+    def __enter__(self) -> "Cosmo_Template":
+        """Apply the template for the duration of a ``with`` block."""
+        return self.apply()
+
+    def __exit__(self, *exc_info):
+        """Restore the previous template at the end of the ``with`` block."""
+        self.restore()
+
+    def __repr__(self) -> str:
+        """Show the template by name."""
+        return f"Cosmo_Template('{self.name}')"
+
+
+def register_template(name: str, style: dict) -> Cosmo_Template:
+    """
+    Add a template to the registry, or replace the one with the same name.
+
+    :param name: Name of the template.
+    :type name: str
+
+    :param style: Values of the template (see :class:`Cosmo_Template`). With an
+        ``"extends"`` key naming another template, only the values that differ from
+        that template are needed.
+    :type style: dict
+
+    :return: The registered template.
+    :rtype: Cosmo_Template
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        register_template(
+            "dark_energy_orange",
+            {"extends": "dark_energy", "brane_color": "#FF8800"},
+        )
+    """
+    _load_registry()
+    style = dict(style)
+    base = style.pop("extends", None)
+    if base is not None:
+        style = {**get_template(base).style, **style}
+    _registry[name] = Cosmo_Template(name, style)
+    return _registry[name]
+
+
+def load_templates(file_name: str) -> list:
+    """
+    Register all the templates of a JSON file.
+
+    The file maps template names to their values, in the same format as the
+    ``templates.json`` file of the package. Files listed in the environment variable
+    ``MANIM_STRING_COSMO_TEMPLATES`` (separated by ``os.pathsep``) are loaded
+    automatically the first time a template is requested.
+
+    :param file_name: Path to the JSON file.
+    :type file_name: str
+
+    :return: Names of the loaded templates.
+    :rtype: list
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        # my_templates.json:
+        # {"night": {"extends": "dark_energy", "bg_color": "#000000"}}
+        load_templates("my_templates.json")
+        import_template_string_cosmo("night")
+    """
+    with open(file_name, encoding="utf-8") as file:
+        styles = json.load(file)
+    for name, style in styles.items():
+        register_template(name, style)
+    return list(styles)
+
+
+def _load_registry():
+    global _registry_loaded
+    if _registry_loaded:
+        return
+    _registry_loaded = True
+    load_templates(_TEMPLATES_FILE)
+    for file_name in os.environ.get("MANIM_STRING_COSMO_TEMPLATES", "").split(os.pathsep):
+        if file_name:
+            load_templates(file_name)
+
+
+def available_templates() -> list:
+    """
+    Names of all registered templates.
+
+    :return: Sorted template names.
+    :rtype: list
+    """
+    _load_registry()
+    return sorted(_registry)
+
+
+def get_template(name: str) -> Cosmo_Template:
+    """
+    Get a registered template by name.
+
+    :param name: Name of the template, e.g. ``"dark_energy"``.
+    :type name: str
+
+    :return: The template.
+    :rtype: Cosmo_Template
+
+    :raises KeyError: If no template has this name.
+    """
+    _load_registry()
+    if name not in _registry:
+        raise KeyError(f"Unknown template '{name}'. Available: {sorted(_registry)}")
+    return _registry[name]
+
+
+def current_template() -> Cosmo_Template:
+    """
+    Return the template in effect, i.e. the last one applied and not restored.
+
+    :return: The template, or ``None`` if no template is applied.
+    :rtype: Cosmo_Template
+    """
+    return _applied[-1] if _applied else None
@@ -0,0 +1,17 @@
+from .profiling import *
+from .prototypes import *
+from .render_farm import *
+from .svg_assets import *
+from .tex_batch import *
+from .tex_cache import *
+from .tracker_bindings import *
+
+__all__ = []
+__all__ += profiling.__all__
+__all__ += prototypes.__all__
+# ``render_farm`` is now the function of the same name, not the module.
+__all__ += ["render_farm"]
+__all__ += svg_assets.__all__
+__all__ += tex_batch.__all__
+__all__ += tex_cache.__all__
+__all__ += tracker_bindings.__all__
@@ -0,0 +1,332 @@
+import importlib
+import inspect
+import json
+import os
+import time
+from contextlib import contextmanager
+from functools import cached_property, wraps
+
+from manim.utils import tex_file_writing
+
+from ..my_imports import *
+
+__all__ = [
+    "enable_profiling",
+    "disable_profiling",
+    "profiling_records",
+    "profiling_report",
+    "dump_profiling",
+    "profile_objects",
+]
+
+
+# Subpackages whose classes are instrumented.
+_PROFILED_PACKAGES = ("objects", "tables_and_plots")
+
+# Manim entry points counted while profiling: (owner, attribute, counter).
+_COUNTED = (
+    (tex_file_writing, "compile_tex", "latex"),
+    (SVGMobject, "get_mobjects_from", "svg"),
+    (Mobject, "__init__", "mobjects"),
+    (Mobject, "add_updater", "updaters"),
+)
+
+_COUNTERS = ("latex", "svg", "mobjects", "updaters")
+
+_profile = {
+    "active": False,
+    "counts": dict.fromkeys(_COUNTERS, 0),
+    "records": [],
+    "stack": [],
+    "origin": None,
+}
+
+
+def _record_call(name: str, kind: str, function, args: tuple, kwargs: dict):
+    counts = _profile["counts"]
+    before = dict(counts)
+    frame = {"children_s": 0.0}
+    _profile["stack"].append(frame)
+    start = time.perf_counter()
+    try:
+        return function(*args, **kwargs)
+    finally:
+        duration = time.perf_counter() - start
+        _profile["stack"].pop()
+        if _profile["stack"]:
+            _profile["stack"][-1]["children_s"] += duration
+        _profile["records"].append(
+            {
+                "name": name,
+                "kind": kind,
+                "start_s": start - _profile["origin"],
+                "total_s": duration,
+                "self_s": duration - frame["children_s"],
+                "depth": len(_profile["stack"]),
+                **{key: counts[key] - before[key] for key in _COUNTERS},
+            }
+        )
+
+
+# Instrumentation stays in place once installed and does nothing while profiling is
+# off: removing it could undo a template applied in between, which also replaces
+# ``__init__``. A template applied later wraps the instrumented ``__init__`` in a
+# partial method, and restoring a template applied earlier drops it, so it is
+# installed again (where missing) every time profiling is enabled.
+
+
+def _timed(name: str, kind: str, function):
+    @wraps(function, updated=())
+    def timed(*args, **kwargs):
+        if not _profile["active"]:
+            return function(*args, **kwargs)
+        return _record_call(name, kind, function, args, kwargs)
+
+    timed._profiled = True
+    return timed
+
+
+def _counted(counter: str, function):
+    @wraps(function, updated=())
+    def counted(*args, **kwargs):
+        if _profile["active"]:
+            _profile["counts"][counter] += 1
+        return function(*args, **kwargs)
+
+    counted._profiled = True
+    return counted
+
+
+def _is_instrumented(function) -> bool:
+    # Look through the partial methods installed by ``set_default``.
+    while function is not None:
+        if getattr(function, "_profiled", False):
+            return True
+        function = getattr(getattr(function, "_partialmethod", None), "func", None)
+    return False
+
+
+def _is_animation_factory(function) -> bool:
+    try:
+        annotation = inspect.signature(function).return_annotation
+    except (TypeError, ValueError):
+        return False
+    return isinstance(annotation, type) and issubclass(annotation, Animation)
+
+
+def _instrument_class(cls: type):
+    # Only what the class defines itself: inherited methods are instrumented on the
+    # class defining them, and would be recorded twice otherwise.
+    if "__init__" in cls.__dict__ and not _is_instrumented(cls.__init__):
+        # ``cls.__init__`` also resolves the partial method of an applied template.
+        cls.__init__ = _timed(cls.__name__, "constructor", cls.__init__)
+    for attribute, value in list(cls.__dict__.items()):
+        name = f"{cls.__name__}.{attribute}"
+        if isinstance(value, cached_property):
+            # Parts built on first access (labels, figures, strings, ...).
+            if not _is_instrumented(value.func):
+                value.func = _timed(name, "part", value.func)
+        elif (
+            inspect.isfunction(value)
+            and not _is_instrumented(value)
+            and _is_animation_factory(value)
+        ):
+            setattr(cls, attribute, _timed(name, "animation", value))
+
+
+def _install():
+    package = __name__.rsplit(".", 2)[0]
+    for subpackage in _PROFILED_PACKAGES:
+        module = importlib.import_module(f"{package}.{subpackage}")
+        for public_name in module.__all__:
+            value = getattr(module, public_name)
+            if isinstance(value, type):
+                _instrument_class(value)
+    for owner, attribute, counter in _COUNTED:
+        if not _is_instrumented(getattr(owner, attribute)):
+            setattr(owner, attribute, _counted(counter, getattr(owner, attribute)))
+
+
+def enable_profiling():
+    """
+    Record every constructor and animation method of the package from now on.
+
+    All classes of ``objects`` and ``tables_and_plots`` are instrumented: their
+    constructors, their animation methods (those returning an :class:`Animation`) and
+    the parts they build on first access. Each call records its wall time (in total,
+    and excluding the instrumented calls it makes) and how many LaTeX compilations,
+    SVG parses, mobjects and updaters it caused. Nothing is instrumented until this
+    is called.
+
+    Setting the environment variable ``MANIM_STRING_COSMO_PROFILE`` to a file name
+    enables profiling when the package is imported and writes a report to that file
+    at the end of every rendered scene (see :func:`dump_profiling`). The file name
+    can contain ``{scene}``, replaced by the name of the scene.
+
+    **Example usage:**
+
+    .. code-block:: bash
+
+        MANIM_STRING_COSMO_PROFILE=profile_{scene}.json manim -ql slides.py
+    """
+    _install()
+    if _profile["origin"] is None:
+        _profile["origin"] = time.perf_counter()
+    _profile["active"] = True
+
+
+def disable_profiling():
+    """Stop recording. The records are kept."""
+    _profile["active"] = False
+    _profile["stack"].clear()
+
+
+def profiling_records(clear: bool = False) -> list:
+    """
+    Every call recorded so far, in the order they finished.
+
+    :param clear: Forget the records after returning them. Default is ``False``.
+    :type clear: bool
+
+    :return: One dictionary per call with the keys ``"name"``, ``"kind"``
+        (``"constructor"``, ``"animation"`` or ``"part"``), ``"start_s"``,
+        ``"total_s"``, ``"self_s"``, ``"depth"``, ``"latex"``, ``"svg"``,
+        ``"mobjects"`` and ``"updaters"``. Counts include the nested calls.
+    :rtype: list
+    """
+    records = list(_profile["records"])
+    if clear:
+        _profile["records"].clear()
+    return records
+
+
+def profiling_report(records: list = None) -> str:
+    """
+    Flat report of the records, one line per name, slowest first.
+
+    :param records: Records as returned by :func:`profiling_records`.
+        Default is all the records so far.
+    :type records: list
+
+    :return: The report as a table.
+    :rtype: str
+    """
+    if records is None:
+        records = _profile["records"]
+    rows = {}
+    for record in records:
+        row = rows.setdefault(
+            record["name"],
+            {"calls": 0, "total_s": 0.0, "self_s": 0.0, **dict.fromkeys(_COUNTERS, 0)},
+        )
+        row["calls"] += 1
+        for key in ("total_s", "self_s", *_COUNTERS):
+            row[key] += record[key]
+
+    header = (
+        f"{'name':<42}{'calls':>7}{'total ms':>11}{'self ms':>10}"
+        f"{'latex':>7}{'svg':>6}{'mobjects':>10}{'updaters':>10}"
+    )
+    lines = [header, "-" * len(header)]
+    for name, row in sorted(rows.items(), key=lambda item: -item[1]["self_s"]):
+        lines.append(
+            f"{name:<42}{row['calls']:>7}{1e3 * row['total_s']:>11.1f}"
+            f"{1e3 * row['self_s']:>10.1f}{row['latex']:>7}{row['svg']:>6}"
+            f"{row['mobjects']:>10}{row['updaters']:>10}"
+        )
+    return "\n".join(lines)
+
+
+def _chrome_trace(records: list) -> dict:
+    events = [
+        {
+            "name": record["name"],
+            "cat": record["kind"],
+            "ph": "X",
+            "ts": round(1e6 * record["start_s"], 1),
+            "dur": round(1e6 * record["total_s"], 1),
+            "pid": os.getpid(),
+            "tid": 0,
+            "args": {key: record[key] for key in _COUNTERS},
+        }
+        for record in records
+    ]
+    return {"traceEvents": sorted(events, key=lambda event: event["ts"])}
+
+
+def dump_profiling(file_name: str, clear: bool = True) -> str:
+    """
+    Write the records to a file.
+
+    Files ending with ``.json`` get a Chrome trace, to open with ``chrome://tracing``
+    or https://ui.perfetto.dev, where nested calls show as a flame chart. Other files
+    get the flat report of :func:`profiling_report`.
+
+    :param file_name: Output file.
+    :type file_name: str
+
+    :param clear: Forget the records once written. Default is ``True``.
+    :type clear: bool
+
+    :return: The file name.
+    :rtype: str
+    """
+    records = profiling_records(clear=clear)
+    with open(file_name, "w", encoding="utf-8") as file:
+        if str(file_name).endswith(".json"):
+            json.dump(_chrome_trace(records), file, indent=1)
+        else:
+            file.write(profiling_report(records) + "\n")
+    return file_name
+
+
+@contextmanager
+def profile_objects(file_name: str = None):
+    """
+    Profile the package objects built and animated inside a ``with`` block.
+
+    :param file_name: File for the report when leaving the block (see
+        :func:`dump_profiling`). Default is to print the flat report.
+    :type file_name: str
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        from manim import *
+        from manim_string_cosmo import *
+
+        class Example_Profile(Scene):
+            def construct(self):
+                with profile_objects("bubble_profile.json"):
+                    bubble = Bubble(bubble_type="GW")
+                    self.play(bubble.fade_in_bulk())
+                    self.play(bubble.create_bubble())
+    """
+    enable_profiling()
+    try:
+        yield
+    finally:
+        disable_profiling()
+        if file_name is None:
+            print(profiling_report(profiling_records(clear=True)))
+        else:
+            dump_profiling(file_name)
+
+
+def _profile_scenes(file_name: str):
+    render = Scene.render
+
+    @wraps(render)
+    def profiled_render(scene, *args, **kwargs):
+        try:
+            return render(scene, *args, **kwargs)
+        finally:
+            dump_profiling(file_name.replace("{scene}", type(scene).__name__))
+
+    Scene.render = profiled_render
+    enable_profiling()
+
+
+if os.environ.get("MANIM_STRING_COSMO_PROFILE"):
+    _profile_scenes(os.environ["MANIM_STRING_COSMO_PROFILE"])
@@ -0,0 +1,250 @@
+import copy
+import types
+from collections import OrderedDict
+
+from ..my_imports import *
+from ..templates.template import current_template
+
+__all__ = [
+    "clone",
+    "prototype",
+    "clear_prototypes",
+    "set_prototype_limits",
+    "prototype_info",
+]
+
+
+# One built instance per (class, arguments, template) for the whole process, least
+# recently used first, with its estimated size in bytes.
+_prototypes = OrderedDict()
+
+_limits = {"max_count": 64, "max_memory_mb": 256}
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _rebind(function, clones: dict, seen: dict = None):
+    # Functions are not copied by ``deepcopy``: a lambda of the original closing over
+    # ``self`` (or over one of its trackers), or taking it as a default argument,
+    # would keep driving the original. Give the copy its own function, closing over
+    # the copies instead. Functions it closes over or takes as defaults (helpers
+    # closing over ``self`` themselves) are rebound the same way.
+    if isinstance(function, types.MethodType):
+        method = _rebind(function.__func__, clones, seen)
+        owner = clones.get(id(function.__self__), function.__self__)
+        if method is function.__func__ and owner is function.__self__:
+            return function
+        return types.MethodType(method, owner)
+    if not isinstance(function, types.FunctionType):
+        return function
+    seen = {} if seen is None else seen
+    if id(function) in seen:
+        return seen[id(function)]
+    # Until it is rebuilt, a function referring to itself keeps the original.
+    seen[id(function)] = function
+
+    changed = []
+
+    def remap(value):
+        new = clones[id(value)] if id(value) in clones else _rebind(value, clones, seen)
+        if new is not value:
+            changed.append(value)
+        return new
+
+    cells = []
+    for cell in function.__closure__ or ():
+        try:
+            content = cell.cell_contents
+        except ValueError:  # Empty cell.
+            cells.append(cell)
+            continue
+        new = remap(content)
+        cells.append(cell if new is content else types.CellType(new))
+    defaults = tuple(remap(value) for value in function.__defaults__ or ())
+    kwdefaults = {
+        name: remap(value) for name, value in (function.__kwdefaults__ or {}).items()
+    }
+    if not changed:
+        return function
+    rebound = types.FunctionType(
+        function.__code__,
+        function.__globals__,
+        function.__name__,
+        defaults or None,
+        tuple(cells) or None,
+    )
+    rebound.__kwdefaults__ = kwdefaults or None
+    rebound.__dict__.update(function.__dict__)
+    seen[id(function)] = rebound
+    return rebound
+
+
+def clone(mob: Mobject) -> Mobject:
+    """
+    Deep copy of a mobject whose updaters and trackers drive the copy.
+
+    :meth:`Mobject.copy` already copies the trackers, the updaters written as
+    methods (e.g. those of :class:`Meter_Bar` and :class:`Radial_Strings`) and the
+    bindings of :func:`bind_to_tracker` (e.g. the dot of :class:`Plot_Instanton`),
+    but updaters written as lambdas closing over the original object (directly,
+    through a helper function or as a default argument), such as
+    ``dot.add_updater(lambda d: d.move_to(plot.ax_ins.c2p(...)))``, keep following
+    the original. Here they (and any other function stored on the copied mobjects)
+    are rebound to the copies.
+
+    :param mob: Mobject to copy.
+    :type mob: Mobject
+
+    :return: The copy.
+    :rtype: Mobject
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        from manim import *
+        from manim_string_cosmo import *
+
+        class Example_Clone(Scene):
+            def construct(self):
+                plot = Plot_Instanton().scale(0.5).to_edge(LEFT)
+                twin = clone(plot).to_edge(RIGHT)
+                self.add(plot, twin)
+                self.play(twin.decay())  # Only the dot of the twin moves.
+    """
+    clones = {}
+    result = copy.deepcopy(mob, clones)
+    for copied in list(clones.values()):
+        if not isinstance(copied, Mobject):
+            continue
+        copied.updaters = [_rebind(updater, clones) for updater in copied.updaters]
+        for name, value in list(copied.__dict__.items()):
+            if isinstance(value, types.FunctionType):
+                setattr(copied, name, _rebind(value, clones))
+    return result
+
+
+def prototype(cls: type, *args, **kwargs) -> Mobject:
+    """
+    Build an object once and return a :func:`clone` of it on every call.
+
+    Instances are kept per class, arguments and current template, so repeated
+    objects (grids of bubbles, many identical black holes, ...) pay for their
+    construction, LaTeX labels included, only once per process. This holds across
+    the scenes of a file rendered together (``manim file.py -a``): an object used in
+    several slides is built for the first one only. The copies are independent: they
+    can be moved, styled and animated separately. The least recently used objects
+    are dropped beyond the limits of :func:`set_prototype_limits`.
+
+    :param cls: Class to build, e.g. :class:`Bubble`.
+    :type cls: type
+
+    :param args: Positional arguments of the class.
+
+    :param kwargs: Keyword arguments of the class.
+
+    :return: A fresh copy of the object.
+    :rtype: Mobject
+
+    .. note::
+
+       Arguments are told apart by their ``repr``. Parts that a class builds on first
+       access (see ``lazy`` in :class:`Bubble`) are only shared if they were built
+       before the copy was made.
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        from manim import *
+        from manim_string_cosmo import *
+
+        class Example_Prototype(Scene):
+            def construct(self):
+                types = ["empty", "radiation", "GW", "strings", "em", "instanton"]
+                bubbles = Group(
+                    *[prototype(Bubble, bubble_type=t).scale(0.4) for t in 2 * types]
+                )
+                self.add(bubbles.arrange_in_grid(3, 4))
+    """
+    key = (cls, repr(args), repr(sorted(kwargs.items())), current_template())
+    if key in _prototypes:
+        _stats["hits"] += 1
+        _prototypes.move_to_end(key)
+        mob, _ = _prototypes[key]
+        return clone(mob)
+
+    _stats["misses"] += 1
+    mob = cls(*args, **kwargs)
+    _prototypes[key] = (mob, _footprint(mob))
+    _evict()
+    return clone(mob)
+
+
+def _footprint(mob: Mobject) -> int:
+    # Points and colors make up nearly all the memory of a mobject.
+    return sum(
+        value.nbytes
+        for sub in mob.get_family()
+        for value in sub.__dict__.values()
+        if isinstance(value, np.ndarray)
+    )
+
+
+def _evict():
+    memory = sum(size for _, size in _prototypes.values())
+    # The most recent prototype always stays, even if larger than the cap.
+    while len(_prototypes) > 1 and (
+        len(_prototypes) > _limits["max_count"]
+        or memory > _limits["max_memory_mb"] * 2**20
+    ):
+        _, (_, size) = _prototypes.popitem(last=False)
+        memory -= size
+        _stats["evictions"] += 1
+
+
+def set_prototype_limits(max_count: int = None, max_memory_mb: float = None):
+    """
+    Bound the objects kept by :func:`prototype`.
+
+    When a limit is exceeded, the least recently used objects are dropped (and
+    built again if requested later).
+
+    :param max_count: Maximum number of objects kept. Default is ``64``.
+    :type max_count: int
+
+    :param max_memory_mb: Maximum memory of the kept objects in MB, estimated from
+        their points and colors. Default is ``256``.
+    :type max_memory_mb: float
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        set_prototype_limits(max_count=16, max_memory_mb=64)
+    """
+    if max_count is not None:
+        _limits["max_count"] = max_count
+    if max_memory_mb is not None:
+        _limits["max_memory_mb"] = max_memory_mb
+    _evict()
+
+
+def prototype_info() -> dict:
+    """
+    Report the state of the objects kept by :func:`prototype`.
+
+    :return: Number of objects kept, their estimated memory in MB, the limits, and the
+        hits, misses and evictions of this process.
+    :rtype: dict
+    """
+    return {
+        "count": len(_prototypes),
+        "memory_mb": sum(size for _, size in _prototypes.values()) / 2**20,
+        **_limits,
+        **_stats,
+    }
+
+
+def clear_prototypes():
+    """Forget all the objects stored by :func:`prototype`."""
+    _prototypes.clear()
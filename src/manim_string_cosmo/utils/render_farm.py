@@ -0,0 +1,249 @@
+import argparse
+import importlib.util
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from ..my_imports import *
+from ..templates.template import available_templates, get_template
+from .svg_assets import FIGURES_DIR, svg_asset
+from .tex_cache import enable_tex_cache
+
+__all__ = ["render_farm"]
+
+
+# Scene files already imported by this worker, by path.
+_scene_modules = {}
+
+
+def _available_cores() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _warm_up(tex_cache_dir) -> Path:
+    # Runs in the parent before the pool starts (forked workers inherit the parsed
+    # figures) and again in every worker (for spawned workers, and to point them all
+    # to the same on-disk LaTeX cache).
+    cache_dir = enable_tex_cache(tex_cache_dir)
+    for figure in sorted(Path(FIGURES_DIR).glob("*.svg")):
+        svg_asset(figure.stem)
+    return cache_dir
+
+
+def _load_scene_module(file_name: str):
+    if file_name not in _scene_modules:
+        directory = str(Path(file_name).parent)
+        if directory not in sys.path:
+            sys.path.insert(0, directory)
+        spec = importlib.util.spec_from_file_location(
+            f"_render_farm_{len(_scene_modules)}", file_name
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _scene_modules[file_name] = module
+    return _scene_modules[file_name]
+
+
+def _output_options(last_frame: bool) -> dict:
+    # Same settings as ``manim -s``. Older manim versions have the two flags as config
+    # keys; recent ones derive both from the output format, and ``tempconfig`` drops
+    # unknown keys silently, so ``write_to_movie`` would be ignored there.
+    if not last_frame:
+        return {}
+    if "write_to_movie" in config:
+        return {"save_last_frame": True, "write_to_movie": False}
+    return {"format": "png"}
+
+
+def _render_job(file_name: str, scene_name: str, template: str, options: dict) -> dict:
+    start = time.perf_counter()
+    error = None
+    try:
+        scene_class = getattr(_load_scene_module(file_name), scene_name)
+        job_config = {
+            **options,
+            "output_file": f"{scene_name}_{template}",
+            # Separate LaTeX work directory per worker, so parallel LaTeX runs never
+            # share files. Compiled labels are shared through the tex cache instead.
+            "tex_dir": str(Path(options["media_dir"]) / "Tex" / f"worker_{os.getpid()}"),
+        }
+        with tempconfig(job_config), get_template(template):
+            scene_class().render()
+    except Exception:
+        error = traceback.format_exc()
+    return {
+        "scene": scene_name,
+        "template": template,
+        "seconds": time.perf_counter() - start,
+        "error": error,
+    }
+
+
+def _print_summary(results: list, wall_time: float):
+    print()
+    print(f"{'status':<8}{'time (s)':>10}  {'scene':<30}template")
+    for result in sorted(results, key=lambda r: (r["scene"], r["template"])):
+        status = "failed" if result["error"] else "ok"
+        print(
+            f"{status:<8}{result['seconds']:>10.1f}  {result['scene']:<30}{result['template']}"
+        )
+    failures = [result for result in results if result["error"]]
+    job_time = sum(result["seconds"] for result in results)
+    print(
+        f"\n{len(results) - len(failures)} rendered, {len(failures)} failed, "
+        f"{wall_time:.1f} s wall time ({job_time:.1f} s of rendering)."
+    )
+    for result in failures:
+        print(f"\n{result['scene']} with '{result['template']}':\n{result['error']}")
+
+
+def render_farm(
+    file_name: str,
+    scenes: list,
+    templates: list = None,
+    jobs: int = None,
+    quality: str = "medium_quality",
+    last_frame: bool = False,
+    media_dir: str = "media",
+    tex_cache_dir: str = None,
+) -> list:
+    r"""
+    Render several scenes with several templates in parallel.
+
+    Every (scene, template) pair is a job for a pool of worker processes. Each worker
+    imports the scene file once, then applies and restores templates (see
+    :class:`Cosmo_Template`) for as many jobs as it gets, so manim and the package are
+    only loaded once per worker. The figures are
+    parsed before the pool starts and compiled LaTeX labels are shared between
+    workers through the on-disk cache of :func:`enable_tex_cache`.
+
+    :param file_name: Python file with the scenes.
+    :type file_name: str
+
+    :param scenes: Names of the scenes to render.
+    :type scenes: list
+
+    :param templates: Names of the templates. Default is every template.
+    :type templates: list
+
+    :param jobs: Number of worker processes. Default is the number of available cores.
+    :type jobs: int
+
+    :param quality: Manim quality, e.g. ``"low_quality"`` or ``"high_quality"``.
+        Default is ``"medium_quality"``.
+    :type quality: str
+
+    :param last_frame: Whether to save only the last frame of each scene, as with
+        ``manim -s``. Default is ``False``.
+    :type last_frame: bool
+
+    :param media_dir: Directory for the rendered files. Default is ``"media"``.
+    :type media_dir: str
+
+    :param tex_cache_dir: Directory of the shared LaTeX cache.
+        Default is the one of :func:`enable_tex_cache`.
+    :type tex_cache_dir: str
+
+    :return: One dictionary per job, with keys ``"scene"``, ``"template"``,
+        ``"seconds"`` and ``"error"`` (``None`` or the traceback of the failure).
+    :rtype: list
+
+    :raises ValueError: If a template does not exist.
+
+    **Example usage:**
+
+    .. code-block:: bash
+
+        string-cosmo-render examples/example_objects.py Example_Bubble Example_Black_Hole \
+            --templates dark_energy blue_ice --quality low_quality --last-frame
+
+    .. code-block:: python
+
+        from manim_string_cosmo import render_farm
+
+        if __name__ == "__main__":
+            render_farm("example_objects.py", ["Example_Bubble"], jobs=4)
+    """
+    templates = available_templates() if templates is None else list(templates)
+    unknown = sorted(set(templates) - set(available_templates()))
+    if unknown:
+        raise ValueError(
+            f"Unknown templates {unknown}. Available: {available_templates()}"
+        )
+
+    file_name = str(Path(file_name).resolve())
+    options = {
+        "input_file": file_name,
+        "quality": quality,
+        "media_dir": str(Path(media_dir).resolve()),
+        "preview": False,
+        **_output_options(last_frame),
+    }
+    pairs = [(scene, template) for scene in scenes for template in templates]
+    jobs = min(jobs or _available_cores(), len(pairs))
+
+    cache_dir = _warm_up(tex_cache_dir)
+    print(f"Rendering {len(pairs)} jobs on {jobs} workers.")
+
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_warm_up, initargs=(cache_dir,)
+    ) as pool:
+        futures = [
+            pool.submit(_render_job, file_name, scene, template, options)
+            for scene, template in pairs
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            status = "failed" if result["error"] else "done"
+            print(f"{status}: {result['scene']} ({result['template']})")
+            results.append(result)
+
+    _print_summary(results, time.perf_counter() - start)
+    return results
+
+
+def main(argv: list = None):
+    """Command line entry point, see :func:`render_farm`."""
+    parser = argparse.ArgumentParser(
+        description="Render manim scenes with several string cosmology templates in parallel."
+    )
+    parser.add_argument("file", help="Python file with the scenes.")
+    parser.add_argument("scenes", nargs="+", help="Names of the scenes to render.")
+    parser.add_argument(
+        "-t",
+        "--templates",
+        nargs="+",
+        choices=available_templates(),
+        help="Default: all templates.",
+    )
+    parser.add_argument("-j", "--jobs", type=int, help="Default: available cores.")
+    parser.add_argument("-q", "--quality", default="medium_quality")
+    parser.add_argument(
+        "-s", "--last-frame", action="store_true", help="Save only the last frame."
+    )
+    parser.add_argument("-o", "--media-dir", default="media")
+    parser.add_argument("--tex-cache-dir", help="Directory of the shared LaTeX cache.")
+    args = parser.parse_args(argv)
+
+    results = render_farm(
+        args.file,
+        args.scenes,
+        templates=args.templates,
+        jobs=args.jobs,
+        quality=args.quality,
+        last_frame=args.last_frame,
+        media_dir=args.media_dir,
+        tex_cache_dir=args.tex_cache_dir,
+    )
+    sys.exit(1 if any(result["error"] for result in results) else 0)
+
+
+if __name__ == "__main__":
+    main()
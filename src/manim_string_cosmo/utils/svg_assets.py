@@ -0,0 +1,66 @@
+from os import path
+
+from ..my_imports import *
+
+__all__ = ["svg_asset", "clear_svg_assets"]
+
+
+FIGURES_DIR = path.join(path.dirname(__file__), "..", "figures")
+
+# One parsed prototype per (file, settings) for the whole process.
+_svg_assets = {}
+
+
+def _resolve(name: str) -> str:
+    if path.isfile(name):
+        return path.abspath(name)
+    figure = path.join(FIGURES_DIR, name if name.endswith(".svg") else f"{name}.svg")
+    if path.isfile(figure):
+        return path.abspath(figure)
+    raise FileNotFoundError(
+        f"SVG asset '{name}' is neither a file nor one of the package figures."
+    )
+
+
+def svg_asset(name: str, **kwargs) -> SVGMobject:
+    """
+    Return a copy of an SVG figure that is parsed only once per process.
+
+    The first request of a file (with given settings) parses it into a prototype.
+    Every later request returns a copy of that prototype, skipping the parsing and the
+    :class:`SVGMobject` set up. Copies are independent and can be styled freely.
+
+    :param name: Name of one of the package figures (e.g. ``"weight"``, ``"astronaut"``,
+        ``"saturn"``) or path to any SVG file.
+    :type name: str
+
+    :param kwargs: Keyword arguments passed to :class:`SVGMobject` when parsing.
+        Different settings are stored as different prototypes.
+
+    :return: A fresh copy of the figure.
+    :rtype: SVGMobject
+
+    :raises FileNotFoundError: If ``name`` is neither a file nor a package figure.
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        from manim import *
+        from manim_string_cosmo import *
+
+        class Example_Svg_Asset(Scene):
+            def construct(self):
+                planets = VGroup(*[svg_asset("planet").scale(0.3) for _ in range(20)])
+                self.add(planets.arrange_in_grid(4, 5))
+    """
+    file_name = _resolve(name)
+    key = (file_name, path.getmtime(file_name), repr(sorted(kwargs.items())))
+    if key not in _svg_assets:
+        _svg_assets[key] = SVGMobject(file_name, **kwargs)
+    return _svg_assets[key].copy()
+
+
+def clear_svg_assets():
+    """Forget all parsed SVG prototypes."""
+    _svg_assets.clear()
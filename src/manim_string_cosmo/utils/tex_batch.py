@@ -0,0 +1,281 @@
+import re
+import subprocess
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from manim.mobject.text import tex_mobject
+from manim.utils.tex_file_writing import compile_tex, delete_nonsvg_files, tex_hash
+
+from ..my_imports import *
+from .tex_cache import _cache_active, _entry_path, _original_generate_mobject
+
+__all__ = ["collect_tex", "compile_tex_batch", "prefetch_tex"]
+
+
+# Stand-in for every label during a dry run: a valid SVG with one small square, so
+# manim parses it as usual (root group included) and layouts get a non-zero size.
+_PLACEHOLDER_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="1" height="1">'
+    '<g><path d="M0 0h1v1H0z"/></g></svg>'
+)
+_BARE_TEMPLATE = TexTemplate(documentclass="", preamble="")
+_STANDALONE = re.compile(r"\\documentclass(?:\[(.*)\])?\{standalone\}")
+
+
+def _texcode(expression: str, environment, tex_template) -> str:
+    if environment is not None:
+        return tex_template.get_texcode_for_expression_in_env(expression, environment)
+    return tex_template.get_texcode_for_expression(expression)
+
+
+def _page(expression: str, environment, box: str) -> str:
+    # Reuse manim's environment wrapping, stripped of everything around the body.
+    body = _texcode(expression, environment, _BARE_TEMPLATE)
+    body = body.split("\\begin{document}")[1].split("\\end{document}")[0]
+    return "\n".join([f"\\begin{{{box}}}", body.strip(), f"\\end{{{box}}}"])
+
+
+def _document(tex_template, entries: list) -> str:
+    # One page per label, in the document class of the template. The standalone class
+    # (manim's default) makes a page of every ``standalone`` environment in ``multi``
+    # mode; with any other class, each label gets its own preview box.
+    documentclass = tex_template.documentclass
+    standalone = _STANDALONE.fullmatch(documentclass.strip())
+    if standalone:
+        options = [o.strip() for o in (standalone[1] or "").split(",") if o.strip()]
+        head = [
+            f"\\documentclass[{','.join([*options, 'multi'])}]{{standalone}}",
+            tex_template.preamble,
+        ]
+        box = "standalone"
+    else:
+        head = [
+            documentclass,
+            tex_template.preamble,
+            "\\usepackage[active,tightpage]{preview}",
+        ]
+        box = "preview"
+    body = [tex_template.post_doc_commands]
+    body += [_page(expression, environment, box) for expression, environment, _ in entries]
+    return "\n".join([*head, "\\begin{document}", *body, "\\end{document}"])
+
+
+@contextmanager
+def _recording_tex(requests: list):
+    # Record what each label asks LaTeX for, and hand back a placeholder SVG instead.
+    original_tex_to_svg_file = tex_mobject.tex_to_svg_file
+    original_generate_mobject = tex_mobject.SingleStringMathTex.generate_mobject
+    original_level = logger.level
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        placeholder = Path(tmp_dir) / "placeholder.svg"
+        placeholder.write_text(_PLACEHOLDER_SVG, encoding="utf-8")
+
+        def record(expression, environment=None, tex_template=None):
+            if tex_template is None:
+                tex_template = config["tex_template"]
+            requests.append((expression, environment, tex_template))
+            return placeholder
+
+        tex_mobject.tex_to_svg_file = record
+        # Plain SVG parsing: the tex cache must not store the placeholder.
+        tex_mobject.SingleStringMathTex.generate_mobject = _original_generate_mobject
+        # The placeholder has none of the groups MathTex looks for in its parts, and
+        # manim logs an error for each label before falling back to the whole SVG.
+        logger.setLevel("CRITICAL")
+        try:
+            yield requests
+        finally:
+            tex_mobject.tex_to_svg_file = original_tex_to_svg_file
+            tex_mobject.SingleStringMathTex.generate_mobject = original_generate_mobject
+            logger.setLevel(original_level)
+
+
+def _build_lazy_assets(built) -> None:
+    # Objects like Bubble only create some labels the first time they are accessed:
+    # build them all, so the dry run records them too.
+    if not isinstance(built, Mobject):
+        return
+    for mob in built.get_family():
+        for asset in getattr(mob, "_lazy_assets", ()):
+            _build_lazy_assets(getattr(mob, asset))
+
+
+def collect_tex(*builders) -> list:
+    """
+    Collect every LaTeX snippet that some objects request, without compiling anything.
+
+    Each builder is called once in a dry run where :class:`MathTex`/:class:`Tex` labels
+    are replaced by a small square. Sub-mobjects built lazily on first access (e.g. the
+    labels of :class:`Bubble`) are built as well. A builder that fails halfway still
+    contributes the labels it requested before failing.
+
+    :param builders: Classes or zero-argument callables building the objects,
+        e.g. ``Table_Energy_Scales`` or ``lambda: Bubble(bubble_type="em")``.
+    :type builders: Callable
+
+    :return: List of ``(expression, environment, tex_template)`` requests.
+    :rtype: list
+    """
+    requests = []
+    with _recording_tex(requests):
+        for builder in builders:
+            try:
+                _build_lazy_assets(builder())
+            except Exception as error:
+                logger.debug(f"collect_tex: {builder} stopped early ({error}).")
+    return requests
+
+
+def _pending(requests: list) -> dict:
+    # Group still-uncompiled requests by template; drop duplicates and cached ones.
+    tex_dir = config.get_dir("tex_dir")
+    groups = {}
+    seen = set()
+    for expression, environment, tex_template in requests:
+        code_hash = tex_hash(_texcode(expression, environment, tex_template))
+        if code_hash in seen or (tex_dir / f"{code_hash}.svg").exists():
+            continue
+        if _cache_active() and _entry_path(expression, environment, tex_template).exists():
+            continue
+        seen.add(code_hash)
+        template_key = (
+            tex_template.documentclass,
+            tex_template.preamble,
+            tex_template.post_doc_commands,
+            str(tex_template.tex_compiler),
+            tex_template.output_format,
+        )
+        groups.setdefault(template_key, (tex_template, []))[1].append(
+            (expression, environment, code_hash)
+        )
+    return groups
+
+
+def _compile_group(tex_template, entries: list) -> int:
+    # A template with a fixed body, or one already using the preview package,
+    # cannot be rewritten into a multi-page document: leave it to manim.
+    if getattr(tex_template, "_body", "") or "{preview}" in tex_template.preamble:
+        return 0
+
+    tex_dir = config.get_dir("tex_dir")
+    tex_dir.mkdir(parents=True, exist_ok=True)
+    batch_name = "batch_" + tex_hash("".join(code_hash for *_, code_hash in entries))
+    tex_file = tex_dir / f"{batch_name}.tex"
+
+    tex_file.write_text(_document(tex_template, entries), encoding="utf-8")
+
+    try:
+        dvi_file = compile_tex(
+            tex_file, tex_template.tex_compiler, tex_template.output_format
+        )
+    except ValueError as error:
+        logger.warning(f"Batch LaTeX run failed, labels will compile one by one: {error}")
+        tex_file.unlink(missing_ok=True)
+        return 0
+
+    try:
+        subprocess.run(
+            [
+                "dvisvgm",
+                *(["--pdf"] if tex_template.output_format == ".pdf" else []),
+                "--page=1-",
+                "--no-fonts",
+                "--verbosity=0",
+                f"--output={(tex_dir / batch_name).as_posix()}-%p.svg",
+                dvi_file.as_posix(),
+            ],
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as error:
+        logger.warning(
+            f"Batch SVG conversion failed, labels will compile one by one: {error}"
+        )
+        for page in tex_dir.glob(f"{batch_name}-*.svg"):
+            page.unlink()
+        tex_file.unlink(missing_ok=True)
+        return 0
+
+    pages = sorted(
+        tex_dir.glob(f"{batch_name}-*.svg"),
+        key=lambda page: int(page.stem.rsplit("-", 1)[1]),
+    )
+
+    placed = 0
+    if len(pages) == len(entries):
+        # Store each page where manim looks for the SVG of that label.
+        for page, (*_, code_hash) in zip(pages, entries):
+            page.replace(tex_dir / f"{code_hash}.svg")
+            placed += 1
+    else:
+        logger.warning(
+            f"Batch LaTeX run gave {len(pages)} pages for {len(entries)} labels, "
+            "labels will compile one by one."
+        )
+        for page in pages:
+            page.unlink()
+
+    tex_file.unlink(missing_ok=True)
+    if not config["no_latex_cleanup"]:
+        delete_nonsvg_files()
+    return placed
+
+
+def compile_tex_batch(requests: list) -> int:
+    """
+    Compile many LaTeX snippets in a single LaTeX run per tex template.
+
+    All snippets sharing a template are typeset as pages of one document, which is
+    then split back into one SVG per snippet, stored where manim expects it. Creating
+    the labels afterwards does not start any LaTeX process.
+
+    :param requests: ``(expression, environment, tex_template)`` tuples, as returned by
+        :func:`collect_tex`.
+    :type requests: list
+
+    :return: Number of snippets compiled.
+    :rtype: int
+
+    .. note::
+
+       Snippets already compiled (or in the :func:`enable_tex_cache` cache) are skipped.
+       If a batch fails, nothing breaks: its snippets are compiled one by one
+       when the labels are created, as usual.
+    """
+    return sum(
+        _compile_group(tex_template, entries)
+        for tex_template, entries in _pending(requests).values()
+    )
+
+
+def prefetch_tex(*builders) -> int:
+    """
+    Compile all the LaTeX that some objects will need in one go.
+
+    Call it once at the top of a scene file (after choosing the template), with the
+    objects that the scenes will build.
+
+    :param builders: Classes or zero-argument callables building the objects.
+    :type builders: Callable
+
+    :return: Number of snippets compiled.
+    :rtype: int
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        from manim import *
+        from manim_string_cosmo import *
+
+        import_template_string_cosmo('dark_energy')
+        prefetch_tex(
+            Table_Energy_Scales,
+            Table_Summary_Induce,
+            lambda: Table_Bh_Embedding(type="split"),
+            Plot_Induced_Potential,
+        )
+    """
+    return compile_tex_batch(collect_tex(*builders))
@@ -0,0 +1,189 @@
+import json
+import os
+from pathlib import Path
+
+from manim.mobject.text import tex_mobject
+from manim.utils.tex_file_writing import tex_hash
+
+from ..my_imports import *
+
+__all__ = ["enable_tex_cache", "disable_tex_cache", "clear_tex_cache", "tex_cache_info"]
+
+
+# Bump when the layout of the stored arrays changes, so old entries are ignored.
+_CACHE_FORMAT = 1
+
+_original_tex_to_svg_file = tex_mobject.tex_to_svg_file
+_original_generate_mobject = tex_mobject.SingleStringMathTex.generate_mobject
+
+_tex_cache = {"dir": None, "hits": 0, "misses": 0}
+
+
+def _default_cache_dir() -> Path:
+    env_dir = os.environ.get("MANIM_STRING_COSMO_TEX_CACHE")
+    if env_dir:
+        return Path(env_dir)
+    xdg_dir = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    return Path(xdg_dir) / "manim_string_cosmo" / "tex"
+
+
+def _cache_active() -> bool:
+    return _tex_cache["dir"] is not None and config.renderer == RendererType.CAIRO
+
+
+def _entry_path(expression: str, environment, tex_template) -> Path:
+    # Same information manim hashes to name its .tex/.svg files: the full tex code,
+    # which already contains the expression, the environment and the template preamble.
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    if environment is not None:
+        code = tex_template.get_texcode_for_expression_in_env(expression, environment)
+    else:
+        code = tex_template.get_texcode_for_expression(expression)
+    return _tex_cache["dir"] / f"{tex_hash(code)}.npz"
+
+
+def _cached_tex_to_svg_file(expression: str, environment=None, tex_template=None):
+    if _cache_active():
+        entry = _entry_path(expression, environment, tex_template)
+        if entry.exists():
+            return entry
+    return _original_tex_to_svg_file(
+        expression, environment=environment, tex_template=tex_template
+    )
+
+
+def _store_entry(mob, entry: Path):
+    index = {id(sub): i for i, sub in enumerate(mob.submobjects)}
+    groups = {
+        name: [index[id(sub)] for sub in group.submobjects if id(sub) in index]
+        for name, group in mob.id_to_vgroup_dict.items()
+    }
+    arrays = {
+        "count": np.array(len(mob.submobjects)),
+        "stroke_widths": np.array([sub.stroke_width for sub in mob.submobjects]),
+        "groups": np.array(json.dumps(groups)),
+    }
+    for i, sub in enumerate(mob.submobjects):
+        arrays[f"points_{i}"] = sub.points
+        arrays[f"fill_{i}"] = sub.fill_rgbas
+        arrays[f"stroke_{i}"] = sub.stroke_rgbas
+
+    # Write to a temporary file first so parallel renders never read half an entry.
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    tmp = entry.with_name(f"{entry.stem}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as file:
+        np.savez_compressed(file, **arrays)
+    os.replace(tmp, entry)
+
+
+def _load_entry(mob, entry: Path):
+    with np.load(entry) as data:
+        glyphs = []
+        for i in range(int(data["count"])):
+            glyph = VMobject()
+            glyph.set_points(data[f"points_{i}"])
+            glyph.fill_rgbas = data[f"fill_{i}"]
+            glyph.stroke_rgbas = data[f"stroke_{i}"]
+            glyph.stroke_width = float(data["stroke_widths"][i])
+            glyphs.append(glyph)
+        groups = json.loads(str(data["groups"]))
+    mob.add(*glyphs)
+    mob.id_to_vgroup_dict = {
+        name: VGroup(*[glyphs[i] for i in indices]) for name, indices in groups.items()
+    }
+
+
+def _cached_generate_mobject(self):
+    if self.file_name.suffix == ".npz":
+        try:
+            _load_entry(self, self.file_name)
+            _tex_cache["hits"] += 1
+            return self
+        except (OSError, KeyError, ValueError):
+            # Broken entry: go through LaTeX again and overwrite it below.
+            self.file_name = _original_tex_to_svg_file(
+                self._get_modified_expression(self.tex_string),
+                environment=self.tex_environment,
+                tex_template=self.tex_template,
+            )
+
+    _original_generate_mobject(self)
+    if _cache_active():
+        _tex_cache["misses"] += 1
+        entry = _entry_path(
+            self._get_modified_expression(self.tex_string),
+            self.tex_environment,
+            self.tex_template,
+        )
+        _store_entry(self, entry)
+    return self
+
+
+def enable_tex_cache(cache_dir: str = None) -> Path:
+    """
+    Keep the geometry of every compiled :class:`MathTex`/:class:`Tex` on disk across runs.
+
+    Each label is stored once as a compressed ``.npz`` file holding its glyph paths.
+    A warm run loads them directly, skipping both the LaTeX subprocess and the SVG parsing.
+
+    :param cache_dir: Directory for the cache entries. Defaults to the
+        ``MANIM_STRING_COSMO_TEX_CACHE`` environment variable, or else
+        ``~/.cache/manim_string_cosmo/tex``.
+    :type cache_dir: str or os.PathLike
+
+    :return: The directory in use.
+    :rtype: Path
+
+    .. note::
+
+       Entries are keyed by the full LaTeX code (tex string, environment and
+       ``tex_template``). The ``font_size`` is not part of the key: it is a uniform
+       scaling applied after loading, so all sizes of a label share one entry.
+       Only the Cairo renderer is cached.
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        from manim_string_cosmo import *
+
+        enable_tex_cache()
+        import_template_string_cosmo('dark_energy')
+    """
+    if cache_dir is None:
+        cache_dir = _default_cache_dir()
+    _tex_cache["dir"] = Path(cache_dir) / f"v{_CACHE_FORMAT}"
+    _tex_cache["dir"].mkdir(parents=True, exist_ok=True)
+    tex_mobject.tex_to_svg_file = _cached_tex_to_svg_file
+    tex_mobject.SingleStringMathTex.generate_mobject = _cached_generate_mobject
+    return _tex_cache["dir"]
+
+
+def disable_tex_cache():
+    """Stop using the on-disk tex cache. Existing entries are kept."""
+    _tex_cache["dir"] = None
+    tex_mobject.tex_to_svg_file = _original_tex_to_svg_file
+    tex_mobject.SingleStringMathTex.generate_mobject = _original_generate_mobject
+
+
+def clear_tex_cache():
+    """Delete every entry of the active on-disk tex cache."""
+    if _tex_cache["dir"] is None:
+        return
+    for entry in _tex_cache["dir"].glob("*.npz"):
+        entry.unlink()
+
+
+def tex_cache_info() -> dict:
+    """
+    Report the state of the on-disk tex cache.
+
+    :return: Directory in use (``None`` if disabled), and hits and misses of this process.
+    :rtype: dict
+    """
+    return dict(_tex_cache)
+
+
+if os.environ.get("MANIM_STRING_COSMO_TEX_CACHE"):
+    enable_tex_cache()
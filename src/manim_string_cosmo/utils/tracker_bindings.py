@@ -0,0 +1,377 @@
+import copy
+import weakref
+from typing import Callable
+
+from ..my_imports import *
+
+__all__ = [
+    "Idle_Updater",
+    "Watched_Tracker",
+    "bind_to_tracker",
+    "unbind_tracker",
+    "update_tracker_bindings",
+    "wake_tracker_dependents",
+]
+
+
+# Mobjects bound to a tracker (weak references, by id), grouped by the id of their
+# axes, and the state of their binding when they were last placed. Each plot, and
+# each copy of it, has its own axes: a frame only looks at the bindings of the axes
+# on screen, not at those of earlier scenes or of stored prototypes.
+_bound = {}
+_placed = {}
+
+# Updaters taken off their mobject while the tracker they follow is idle, by tracker.
+_sleeping = weakref.WeakKeyDictionary()
+
+
+class Watched_Tracker(ValueTracker):
+    """
+    :class:`ValueTracker` that wakes up the mobjects depending on it when it changes.
+
+    Manim counts a mobject with an updater as moving in every animation, and draws it
+    again on every frame, even if nothing it follows has changed. The mobjects
+    following a watched tracker (bound with :func:`bind_to_tracker`, or a
+    :class:`Meter_Bar`) drop their updater after a frame where nothing changed, so
+    they are drawn once into the static background of the animations that do not
+    concern them. As soon as the value changes, or an animation of the tracker
+    begins, its own dependents get their updater back; those of other trackers stay
+    idle.
+
+    Idle dependents only follow changes of the tracker: while it does not change,
+    they move with their axes or frame only when moved together with them (e.g. as
+    parts of the same plot). Animations setting the value through ``set_value``
+    without changing it at their start (e.g. :class:`UpdateFromAlphaFunc`) should
+    be preceded by ``wake_tracker_dependents(tracker)``.
+
+    :param value: Initial value. Default is ``0``.
+    :type value: float
+
+    :param kwargs: Additional keyword arguments passed to :class:`ValueTracker`.
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        from manim import *
+        from manim_string_cosmo import *
+
+        class Example_Watched_Tracker(Scene):
+            def construct(self):
+                axes = Axes(x_range=[0, 4], y_range=[0, 2])
+                tracker = Watched_Tracker(1)
+                dot = bind_to_tracker(Dot(), tracker, axes)
+                self.add(axes, dot)
+                self.play(tracker.animate.set_value(3))
+                self.play(Write(Text("Static dot").to_edge(UP)))  # Dot not redrawn.
+    """
+
+    def set_value(self, value: float) -> "Watched_Tracker":
+        """
+        Set the value, and wake up the dependents if it changed.
+
+        :param value: New value.
+        :type value: float
+
+        :return: The tracker.
+        :rtype: Watched_Tracker
+        """
+        changed = value != self.get_value()
+        super().set_value(value)
+        if changed:
+            wake_tracker_dependents(self)
+        return self
+
+    def interpolate(
+        self,
+        mobject1: Mobject,
+        mobject2: Mobject,
+        alpha: float,
+        path_func: Callable = straight_path(),
+    ) -> "Watched_Tracker":
+        """
+        Interpolate between two trackers, and wake up the dependents if they differ.
+
+        :param mobject1: Tracker at ``alpha = 0``.
+        :type mobject1: Mobject
+
+        :param mobject2: Tracker at ``alpha = 1``.
+        :type mobject2: Mobject
+
+        :param alpha: Interpolation parameter.
+        :type alpha: float
+
+        :param path_func: Path followed by the points. Default is a straight path.
+        :type path_func: Callable
+
+        :return: The tracker.
+        :rtype: Watched_Tracker
+        """
+        # Called with alpha = 0 when an animation of the tracker begins, before manim
+        # sorts out moving and static mobjects.
+        super().interpolate(mobject1, mobject2, alpha, path_func)
+        if mobject1.get_value() != mobject2.get_value():
+            wake_tracker_dependents(self)
+        return self
+
+
+class Idle_Updater:
+    """
+    Updater of a mobject that is taken off it while the tracker it follows is idle.
+
+    The updater itself decides when nothing changed and calls :meth:`sleep` with
+    the tracker it follows, which must be a :class:`Watched_Tracker`: its next
+    change puts the updater back on the mobject. This is how :func:`bind_to_tracker`
+    and :class:`Meter_Bar` keep idle mobjects out of the moving ones.
+
+    :param mob: Mobject holding the updater.
+    :type mob: Mobject
+
+    :param updater: Updater of ``mob``, already added to it or about to be.
+    :type updater: Callable
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        from manim import *
+        from manim_string_cosmo import *
+
+        class Example_Idle_Updater(Scene):
+            def construct(self):
+                tracker = Watched_Tracker(0)
+                label = DecimalNumber(0)
+
+                def follow(mob):
+                    if mob.get_value() == tracker.get_value():
+                        mob.idle_updater.sleep(tracker)
+                    else:
+                        mob.set_value(tracker.get_value())
+
+                label.idle_updater = Idle_Updater(label, follow)
+                label.add_updater(follow)
+                self.add(label)
+                self.play(tracker.animate.set_value(10))
+    """
+
+    def __init__(self, mob: Mobject, updater: Callable):
+        self.mob = mob
+        self.updater = updater
+        self.tracker = None
+
+    def __deepcopy__(self, memo: dict) -> "Idle_Updater":
+        """Copy along with the mobject, asleep on the copy of its tracker if asleep."""
+        # The tracker itself if it was not copied along.
+        result = Idle_Updater(copy.deepcopy(self.mob, memo), self.updater)
+        if self.tracker is not None:
+            result.sleep(memo.get(id(self.tracker), self.tracker))
+        return result
+
+    def sleep(self, tracker: ValueTracker):
+        """
+        Take the updater off the mobject until ``tracker`` changes.
+
+        :param tracker: Tracker followed by the updater.
+        :type tracker: ValueTracker
+        """
+        # A new list: manim may be iterating over the current one.
+        self.mob.updaters = [u for u in self.mob.updaters if u is not self.updater]
+        self.tracker = tracker
+        _sleeping.setdefault(tracker, weakref.WeakSet()).add(self)
+
+    def wake(self):
+        """Put the updater back on the mobject."""
+        self.tracker = None
+        if self.updater not in self.mob.updaters:
+            self.mob.updaters = [*self.mob.updaters, self.updater]
+
+
+def wake_tracker_dependents(tracker: ValueTracker = None):
+    """
+    Give their updater back to the mobjects that dropped it.
+
+    Mobjects following a watched tracker drop their updater while it is idle. It is
+    called by :class:`Watched_Tracker` with itself whenever its value changes.
+
+    :param tracker: Tracker whose dependents are woken up. Default is ``None``, to
+        wake up the dependents of every tracker.
+    :type tracker: ValueTracker
+    """
+    if tracker is None:
+        sleepers = [idle for group in list(_sleeping.values()) for idle in list(group)]
+        _sleeping.clear()
+    else:
+        sleepers = list(_sleeping.pop(tracker, ()))
+    for idle in sleepers:
+        idle.wake()
+
+
+def _state(mob: Mobject) -> np.ndarray:
+    # Tracker value, fixed coordinate, and enough of the axes (both ends of the
+    # x axis, top of the y axis) to notice that they were moved, scaled or rotated.
+    tracker, axes, y = mob.tracker_binding
+    return np.concatenate(
+        [
+            [tracker.get_value(), y],
+            axes.x_axis.points[[0, -1]].ravel(),
+            axes.y_axis.points[-1],
+        ]
+    )
+
+
+def _forget(key: int, axes_key: int):
+    group = _bound.get(axes_key, {})
+    group.pop(key, None)
+    if not group:
+        _bound.pop(axes_key, None)
+    _placed.pop(key, None)
+
+
+def _register(mob: Mobject):
+    key = id(mob)
+    axes_key = id(mob.tracker_binding[1])
+    group = _bound.setdefault(axes_key, {})
+    ref = group.get(key)
+    if ref is not None and ref() is mob:
+        return
+
+    # Copies of a bound mobject (``copy``, :func:`clone`, ...) carry the binding and
+    # the updater, and are registered here the first time they are updated.
+    group[key] = weakref.ref(mob, lambda _: _forget(key, axes_key))
+    _placed.pop(key, None)
+
+
+def _follow(mob: Mobject):
+    # Updater shared by every bound mobject. It only checks its own binding; the
+    # first one found changed in a frame moves all the changed ones of its axes at
+    # once, so the others return right away.
+    _register(mob)
+    placed = _placed.get(id(mob))
+    if placed is not None and np.array_equal(_state(mob), placed):
+        tracker = mob.tracker_binding[0]
+        if isinstance(tracker, Watched_Tracker):
+            mob.idle_updater.sleep(tracker)
+        return
+    update_tracker_bindings(mob.tracker_binding[1])
+
+
+def bind_to_tracker(
+    mob: Mobject, tracker: ValueTracker, axes: CoordinateSystem, y: float = 0
+) -> Mobject:
+    """
+    Keep a mobject at the point ``(tracker value, y)`` of some axes.
+
+    All the bound mobjects share one updater, and the bindings are kept per axes. In
+    a frame, each one only compares the value of its tracker (and the position of
+    its axes) with the ones it was last placed for. Bindings of the same axes that
+    changed are then placed all together, with one call of ``coords_to_point`` for
+    all their points, and mobjects whose tracker is idle are not touched. With a
+    :class:`Watched_Tracker`, idle mobjects drop their updater altogether until the
+    value changes.
+
+    :param mob: Mobject to move, e.g. a :class:`Dot`.
+    :type mob: Mobject
+
+    :param tracker: Tracker holding the first coordinate.
+    :type tracker: ValueTracker
+
+    :param axes: Axes of the coordinates.
+    :type axes: CoordinateSystem
+
+    :param y: Second coordinate, fixed. Default is ``0``.
+    :type y: float
+
+    :return: The same ``mob``, already at its point.
+    :rtype: Mobject
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        from manim import *
+        from manim_string_cosmo import *
+
+        class Example_Bind_To_Tracker(Scene):
+            def construct(self):
+                axes = Axes(x_range=[0, 4], y_range=[0, 2])
+                trackers = [ValueTracker(0) for _ in range(20)]
+                dots = VGroup(
+                    *[
+                        bind_to_tracker(Dot(), tracker, axes, y=i / 10)
+                        for i, tracker in enumerate(trackers)
+                    ]
+                )
+                self.add(axes, dots)
+                self.play(
+                    *[t.animate.set_value(1 + i / 7) for i, t in enumerate(trackers)]
+                )
+    """
+    if "tracker_binding" in mob.__dict__:
+        _forget(id(mob), id(mob.tracker_binding[1]))
+    mob.tracker_binding = (tracker, axes, y)
+    mob.idle_updater = Idle_Updater(mob, _follow)
+    _register(mob)
+    if _follow not in mob.updaters:
+        mob.add_updater(_follow)
+    update_tracker_bindings(axes)
+    return mob
+
+
+def unbind_tracker(mob: Mobject) -> Mobject:
+    """
+    Stop moving a mobject bound with :func:`bind_to_tracker`.
+
+    :param mob: Bound mobject.
+    :type mob: Mobject
+
+    :return: The same ``mob``, left where it is.
+    :rtype: Mobject
+    """
+    mob.remove_updater(_follow)
+    binding = mob.__dict__.pop("tracker_binding", None)
+    mob.__dict__.pop("idle_updater", None)
+    if binding is not None:
+        _forget(id(mob), id(binding[1]))
+    return mob
+
+
+def update_tracker_bindings(axes: CoordinateSystem = None):
+    """
+    Place the bound mobjects whose tracker value or axes changed.
+
+    Changes are counted from the last time each mobject was placed. It is called by
+    the updater of the bound mobjects with their axes, and only needs to be called
+    directly to place them outside of an animation.
+
+    :param axes: Only place the mobjects bound to these axes. Default is ``None``, to
+        place the mobjects bound to any axes.
+    :type axes: CoordinateSystem
+    """
+    if axes is None:
+        refs = [ref for group in list(_bound.values()) for ref in list(group.values())]
+    else:
+        refs = list(_bound.get(id(axes), {}).values())
+    # Mobjects whose updating is suspended (e.g. while animated) are left alone.
+    mobs = [
+        mob
+        for mob in (ref() for ref in refs)
+        if mob is not None
+        and "tracker_binding" in mob.__dict__
+        and not mob.updating_suspended
+    ]
+    if not mobs:
+        return
+    states = np.array([_state(mob) for mob in mobs])
+    never = np.full(states.shape[1], np.nan)
+    placed = np.array([_placed.get(id(mob), never) for mob in mobs])
+    changed = np.flatnonzero(np.any(states != placed, axis=1))
+
+    groups = {}
+    for i in changed:
+        mob_axes = mobs[i].tracker_binding[1]
+        groups.setdefault(id(mob_axes), (mob_axes, []))[1].append(i)
+    for mob_axes, indices in groups.values():
+        points = mob_axes.coords_to_point(states[indices, :2]).reshape(-1, 3)
+        for i, point in zip(indices, points):
+            mobs[i].move_to(point)
+            _placed[id(mobs[i])] = states[i]
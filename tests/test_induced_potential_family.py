@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim_string_cosmo import Induced_Potential_Family  # noqa: E402
+
+
+def test_evaluate_rows_match_separate_calls():
+    """Each row of ``evaluate`` is the variant evaluated on its own."""
+    family = Induced_Potential_Family()
+    a = np.linspace(1.2, 6, 50)
+    variants = [(5, 0), (10, 0), (5, 0.9 / 40)]
+
+    rows = family.evaluate(a, variants)
+
+    assert rows.shape == (len(variants), len(a))
+    for row, (junction, cc) in zip(rows, variants):
+        np.testing.assert_allclose(row, family(a, junction=junction, cc=cc))
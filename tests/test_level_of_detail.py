@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import ORIGIN, VMobject  # noqa: E402
+
+from manim_string_cosmo import decimate_curve  # noqa: E402
+
+
+def test_decimate_curve_round_trip_restores_the_curve():
+    """Scaling down and back up gives back the original bezier points."""
+    x = np.linspace(-3, 3, 200)
+    curve = VMobject().set_points_smoothly(
+        np.stack([x, np.sin(2 * x), np.zeros_like(x)], axis=1)
+    )
+    decimate_curve(curve)
+    original = curve.points.copy()
+
+    curve.scale(0.1, about_point=ORIGIN)
+    decimate_curve(curve)
+    assert len(curve.points) < len(original)
+
+    curve.scale(10, about_point=ORIGIN)
+    decimate_curve(curve)
+    np.testing.assert_allclose(curve.points, original, atol=1e-9)
@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import Axes  # noqa: E402
+
+from manim_string_cosmo import Plot_General  # noqa: E402
+
+
+@pytest.mark.parametrize("adaptive", [True, False])
+def test_plot_function_accepts_piecewise_scalar_functions(adaptive):
+    """A scalar-only function with a branch on ``x`` is plotted point by point."""
+    axes = Axes(x_range=[0, 2, 1], y_range=[0, 4, 1])
+    graph = Plot_General().plot_function(
+        axes,
+        lambda x: 0 if x < 1 else x**2,
+        x_range=[0, 2],
+        adaptive=adaptive,
+        use_smoothing=False,
+    )
+
+    x, y = axes.point_to_coords(graph.get_anchors()).T[:2]
+    np.testing.assert_allclose(y, np.where(x < 1, 0, x**2), atol=1e-6)
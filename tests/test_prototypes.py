@@ -0,0 +1,42 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import Dot, Group, ValueTracker  # noqa: E402
+
+from manim_string_cosmo import clone  # noqa: E402
+
+
+def _closure(tracker):
+    return lambda dot: dot.set_x(tracker.get_value())
+
+
+def _default(tracker):
+    return lambda dot, tracker=tracker: dot.set_x(tracker.get_value())
+
+
+def _kwdefault(tracker):
+    return lambda dot, *, tracker=tracker: dot.set_x(tracker.get_value())
+
+
+def _nested(tracker):
+    def position():
+        return tracker.get_value()
+
+    return lambda dot: dot.set_x(position())
+
+
+@pytest.mark.parametrize("updater", [_closure, _default, _kwdefault, _nested])
+def test_clone_updater_moves_the_clone(updater):
+    """The updater of a clone follows the tracker of the clone, not the original."""
+    tracker = ValueTracker(0)
+    dot = Dot().add_updater(updater(tracker))
+    original = Group(dot, tracker)
+
+    twin = clone(original)
+    twin[1].set_value(2)
+    twin.update()
+    original.update()
+
+    assert twin[0].get_x() == pytest.approx(2)
+    assert dot.get_x() == pytest.approx(0)
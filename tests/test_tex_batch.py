@@ -0,0 +1,50 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import MathTex, TexTemplate  # noqa: E402
+
+from manim_string_cosmo import Bubble, Table_Energy_Scales, collect_tex  # noqa: E402
+from manim_string_cosmo.utils.tex_batch import _document  # noqa: E402
+
+
+def test_collect_tex_gets_every_label_of_a_table():
+    """Every label of a table is recorded, not only the first one."""
+    requests = collect_tex(Table_Energy_Scales)
+
+    # 3 titles and 4 rows of 3 cells.
+    assert len(requests) == 15
+    expressions = [expression for expression, *_ in requests]
+    assert "L" in expressions
+    assert "\\tilde{\\ell}_{5}" in expressions
+
+
+def test_collect_tex_gets_the_lazy_labels_of_a_bubble():
+    """Labels that a bubble only builds on first access are recorded too."""
+    requests = collect_tex(lambda: Bubble(bubble_type="empty"))
+
+    expressions = [expression for expression, *_ in requests]
+    for label in ["k_{-}", "k_{+}", "V(\\phi_{-})", "r=a(\\tau)"]:
+        assert label in expressions
+
+
+def test_collect_tex_keeps_mathtex_usable():
+    """Labels split in parts are built and laid out from the placeholder."""
+    built = []
+    requests = collect_tex(lambda: built.append(MathTex("a", "+", "b").arrange()))
+
+    assert len(requests) == 1
+    assert len(built) == 1 and built[0].width > 0
+
+
+def test_batch_document_keeps_the_document_class():
+    """The batch document uses the document class of the template."""
+    entries = [("x", None, "h1"), ("y", None, "h2")]
+
+    standalone = _document(TexTemplate(), entries)
+    assert standalone.startswith("\\documentclass[preview,multi]{standalone}")
+    assert standalone.count("\\begin{standalone}") == 2
+
+    report = _document(TexTemplate(documentclass="\\documentclass{report}"), entries)
+    assert report.startswith("\\documentclass{report}")
+    assert report.count("\\begin{preview}") == 2